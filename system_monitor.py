@@ -3,41 +3,82 @@
 import psutil
 import time
 import os
+import heapq
+import asyncio
 import platform
 import socket
 import datetime
 from typing import Dict, List, Tuple
-from collections import defaultdict
+from collections import defaultdict, Counter
+from functools import lru_cache
 import subprocess
 from art import text2art, art
 
+@lru_cache(maxsize=16)
+def _render_header(style: str, hostname: str) -> str:
+    """Render one bordered ASCII header; text2art parses a font file per
+    call, so each (style, hostname) pair is rendered exactly once"""
+    header = text2art("System Monitor", font=style)
+    header += "\n" + text2art(hostname, font='small')
+
+    # Add decorative border
+    width = max(len(line) for line in header.split('\n'))
+    border = '=' * width
+
+    return f"{border}\n{header}\n{border}"
+
 class SystemMonitor:
     def __init__(self):
-        self.command_history = defaultdict(int)
+        self.command_history = Counter()
         self.command_times = defaultdict(list)
         self.start_time = time.time()
-
-    def get_system_info(self) -> Dict[str, str]:
-        """Get basic system information"""
-        return {
+        # Read position into ~/.bash_history so repeated stat calls only
+        # parse lines appended since the previous one
+        self._hist_offset = 0
+        self._hist_total = 0
+        # Prime psutil's CPU counters so later interval=None reads return
+        # usage since the previous call without sleeping
+        psutil.cpu_percent(interval=None, percpu=True)
+        # Platform identity and boot time never change while we run, so
+        # read them once instead of on every refresh
+        self._static_sys = {
             'os': platform.system(),
             'release': platform.release(),
             'version': platform.version(),
             'machine': platform.machine(),
             'processor': platform.processor(),
-            'hostname': socket.gethostname(),
-            'uptime': self._get_uptime()
+            'hostname': socket.gethostname()
         }
+        self._boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
+        # Core/thread counts are fixed for the life of the process
+        self._cores = psutil.cpu_count()
+        self._threads = psutil.cpu_count(logical=True)
+        # Mount table rarely changes and statvfs is slow on network mounts,
+        # so disk usage is re-sampled at most every few seconds
+        self._partitions = psutil.disk_partitions()
+        self._disk_cache: List[Dict[str, str]] = []
+        self._disk_next = 0.0
+        # Interface speed/MTU/link state rarely move; refresh the
+        # /sys/class/net scan on a slow cadence, not every frame
+        self._if_stats: Dict[str, Dict[str, float]] = {}
+        self._if_next = 0.0
+
+    def get_system_info(self) -> Dict[str, str]:
+        """Get basic system information"""
+        return {**self._static_sys, 'uptime': self._get_uptime()}
 
     def get_cpu_info(self) -> Dict[str, float]:
         """Get CPU usage information"""
-        cpu_percent = psutil.cpu_percent(interval=1, percpu=True)
+        # One non-blocking sample (vs two interval=1 sleeps); the total is
+        # the mean of the per-CPU readings
+        cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
+        freq = psutil.cpu_freq()
         return {
-            'total': psutil.cpu_percent(interval=1),
+            'total': sum(cpu_percent) / len(cpu_percent) if cpu_percent else 0.0,
             'per_cpu': cpu_percent,
-            'freq': psutil.cpu_freq().current if hasattr(psutil.cpu_freq(), 'current') else 0,
-            'cores': psutil.cpu_count(),
-            'threads': psutil.cpu_count(logical=True)
+            'freq': getattr(freq, 'current', 0),
+            'cores': self._cores,
+            'threads': self._threads
         }
 
     def get_memory_info(self) -> Dict[str, float]:
@@ -55,8 +96,12 @@ class SystemMonitor:
 
     def get_disk_info(self) -> List[Dict[str, str]]:
         """Get disk usage information"""
+        now = time.monotonic()
+        if now < self._disk_next:
+            return self._disk_cache
+
         disks = []
-        for partition in psutil.disk_partitions():
+        for partition in self._partitions:
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
                 disks.append({
@@ -69,33 +114,44 @@ class SystemMonitor:
                 })
             except (PermissionError, FileNotFoundError):
                 continue
+
+        self._disk_cache = disks
+        self._disk_next = now + 5.0
         return disks
 
     def get_network_info(self) -> Dict[str, Dict[str, float]]:
         """Get network usage information"""
         net_io = psutil.net_io_counters()
-        net_if = psutil.net_if_stats()
-        return {
-            'bytes_sent': net_io.bytes_sent,
-            'bytes_recv': net_io.bytes_recv,
-            'packets_sent': net_io.packets_sent,
-            'packets_recv': net_io.packets_recv,
-            'interfaces': {
+        now = time.monotonic()
+        if now >= self._if_next:
+            self._if_stats = {
                 iface: {
-                    'speed': stats.speed if hasattr(stats, 'speed') else 0,
+                    'speed': getattr(stats, 'speed', 0),
                     'mtu': stats.mtu,
                     'up': stats.isup
                 }
-                for iface, stats in net_if.items()
+                for iface, stats in psutil.net_if_stats().items()
             }
+            self._if_next = now + 10.0
+        return {
+            'bytes_sent': net_io.bytes_sent,
+            'bytes_recv': net_io.bytes_recv,
+            'packets_sent': net_io.packets_sent,
+            'packets_recv': net_io.packets_recv,
+            'interfaces': self._if_stats
         }
 
     def get_process_info(self) -> List[Dict[str, str]]:
         """Get information about top processes"""
+        # Top five via a bounded heap; no need to sort every process on
+        # the box just to keep five of them
+        top = heapq.nlargest(
+            5,
+            psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']),
+            key=lambda p: p.info.get('cpu_percent') or 0.0
+        )
         processes = []
-        for proc in sorted(psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']),
-                          key=lambda p: p.info['cpu_percent'],
-                          reverse=True)[:5]:
+        for proc in top:
             try:
                 processes.append({
                     'pid': proc.info['pid'],
@@ -111,27 +167,32 @@ class SystemMonitor:
         """Get command history statistics"""
         history_file = os.path.expanduser('~/.bash_history')
         try:
+            # History rewritten shorter (bash without histappend truncates
+            # on exit) would leave the offset past EOF and drop every
+            # command after it; restart from the top instead
+            if os.stat(history_file).st_size < self._hist_offset:
+                self._hist_offset = 0
             with open(history_file, 'r') as f:
+                # Resume from where the last call stopped so only newly
+                # appended commands are parsed (and counted once)
+                f.seek(self._hist_offset)
                 history = f.readlines()
-            
-            for cmd in history:
-                cmd = cmd.strip()
-                if cmd:
-                    self.command_history[cmd] += 1
-            
+                self._hist_offset = f.tell()
+
+            self._hist_total += len(history)
+            self.command_history.update(cmd for cmd in map(str.strip, history) if cmd)
+
             return {
-                'total_commands': len(history),
+                'total_commands': self._hist_total,
                 'unique_commands': len(self.command_history),
-                'top_commands': sorted(self.command_history.items(),
-                                    key=lambda x: x[1],
-                                    reverse=True)[:5]
+                'top_commands': self.command_history.most_common(5)
             }
         except FileNotFoundError:
             return {'error': 'History file not found'}
 
     def _get_uptime(self) -> str:
         """Get system uptime in human-readable format"""
-        uptime = datetime.datetime.now() - datetime.datetime.fromtimestamp(psutil.boot_time())
+        uptime = datetime.datetime.now() - self._boot_time
         days = uptime.days
         hours, remainder = divmod(uptime.seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
@@ -143,33 +204,46 @@ class SystemMonitor:
         
         if style == 'random':
             style = styles[int(time.time()) % len(styles)]
-        
-        hostname = socket.gethostname()
-        header = text2art(f"System Monitor", font=style)
-        header += "\n" + text2art(hostname, font='small')
-        
-        # Add decorative border
-        width = max(len(line) for line in header.split('\n'))
-        border = '=' * width
-        
-        return f"{border}\n{header}\n{border}"
 
-    def get_all_metrics(self) -> Dict[str, any]:
-        """Get all system metrics in one call"""
+        return _render_header(style, self._static_sys['hostname'])
+
+    async def get_all_metrics_async(self) -> Dict[str, any]:
+        """Get all system metrics, collecting the independent ones concurrently"""
+        # The sub-collectors don't depend on each other, so one refresh
+        # costs the slowest syscall instead of the sum of all of them
+        system, cpu, memory, disk, network, processes, history = await asyncio.gather(
+            *[asyncio.to_thread(fn) for fn in (
+                self.get_system_info,
+                self.get_cpu_info,
+                self.get_memory_info,
+                self.get_disk_info,
+                self.get_network_info,
+                self.get_process_info,
+                self.get_command_history_stats
+            )]
+        )
         return {
-            'system': self.get_system_info(),
-            'cpu': self.get_cpu_info(),
-            'memory': self.get_memory_info(),
-            'disk': self.get_disk_info(),
-            'network': self.get_network_info(),
-            'processes': self.get_process_info(),
-            'history': self.get_command_history_stats()
+            'system': system,
+            'cpu': cpu,
+            'memory': memory,
+            'disk': disk,
+            'network': network,
+            'processes': processes,
+            'history': history
         }
 
+    def get_all_metrics(self) -> Dict[str, any]:
+        """Get all system metrics in one call"""
+        return asyncio.run(self.get_all_metrics_async())
+
 if __name__ == '__main__':
     monitor = SystemMonitor()
     print(monitor.get_ascii_header())
     print("\nSystem Metrics:")
     metrics = monitor.get_all_metrics()
-    import json
-    print(json.dumps(metrics, indent=2)) 
\ No newline at end of file
+    try:
+        import orjson  # C serializer; worthwhile when this path is scripted
+        print(orjson.dumps(metrics, option=orjson.OPT_INDENT_2).decode())
+    except ImportError:
+        import json
+        print(json.dumps(metrics, indent=2, default=str))
\ No newline at end of file
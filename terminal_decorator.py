@@ -2,12 +2,12 @@
 
 import os
 import sys
-import time
 import yaml
+import signal
 import psutil
-import threading
 import asyncio
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 from rich.console import Console
@@ -24,7 +24,7 @@ from animation_manager import AnimationManager
 from system_monitor import SystemMonitor
 from theme_manager import ThemeManager
 from text_manager import TextManager
-from performance_manager import PerformanceManager
+from performance_manager import PerformanceManager, PerformanceMetrics
 from tool_integration import ToolIntegration
 from security_manager import SecurityManager, SecurityError
 from prompt_toolkit import Application
@@ -33,6 +33,11 @@ from prompt_toolkit.layout.containers import Window
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.layout import Layout as PTLayout
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _Loader
+
 class TerminalDecorator:
     def __init__(self, config_path: str = "config.yaml"):
         # Initialize security manager first
@@ -45,12 +50,55 @@ class TerminalDecorator:
         self.console = Console()
         self.performance_manager = PerformanceManager(self.config)
         self.tool_integration = ToolIntegration()
+        self.animation_manager = AnimationManager()
+        # The render loop reports each frame boundary so adaptive
+        # optimization acts on measured frame times instead of the
+        # 60 FPS assumption ResourceMonitor starts from
+        self.animation_manager.frame_callback = (
+            self.performance_manager.resource_monitor.record_frame
+        )
         
-        # Lazy load other components
+        # Lazy load other components; the system monitor is only built
+        # the first time its feature flag flips on, so users who never
+        # enable it skip its psutil priming and history read
+        self.system_monitor: Optional[SystemMonitor] = None
         self._init_core_features()
+        # Reused across frames: the panel shell and the cells that never
+        # change, so a refresh only allocates the cells that do
+        self._sec_labels = (
+            Text("Shell Config:", style="cyan"),
+            Text("Backups:", style="cyan"),
+            Text("Latest Backup:", style="cyan"),
+            Text("File Integrity:", style="cyan")
+        )
+        self._sec_path_text = Text(str(self.shell_config_path), style="blue")
+        self._sec_panel = Panel(Text(), title="Security Status", border_style="red")
+        # Integrity hashes and backup listings are recomputed only when
+        # the underlying mtimes move, not once per frame
+        self._integrity_cache = (None, False)
+        self._backups_cache = (None, [])
         self.running = True
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
+        # Single reusable worker for blocking psutil/render work so each
+        # refresh doesn't pay thread spin-up and the event loop stays free
+        self._update_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Update")
+        self.update_task: Optional[asyncio.Task] = None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # Constructed outside a loop; the caller awaits start()
+        else:
+            self.update_task = asyncio.create_task(self._update_loop())
+
+    def _ensure_system_monitor(self) -> SystemMonitor:
+        """Construct the system monitor on first use"""
+        if self.system_monitor is None:
+            self.system_monitor = SystemMonitor()
+        return self.system_monitor
+
+    async def start(self) -> None:
+        """Start the update loop when __init__ ran outside an event loop"""
+        if self.update_task is None:
+            self.update_task = asyncio.create_task(self._update_loop())
 
     @property
     def shell_config_path(self) -> Path:
@@ -71,7 +119,7 @@ class TerminalDecorator:
                 raise SecurityError(f"Access denied to config file: {config_path}")
             
             with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=_Loader)
         
         except Exception as e:
             self.console.print(f"[red]Error loading config: {e}[/]")
@@ -118,36 +166,46 @@ class TerminalDecorator:
         """Create a panel showing security information"""
         table = Table(show_header=False, box=None)
         
-        # Show backup status
-        backups = self.security_manager.backup_manager.list_backups(self.shell_config_path)
+        # Show backup status; rescan the backup tree only when one of the
+        # category directories has changed
+        backup_dir = self.security_manager.backup_manager.backup_dir
+        try:
+            dir_mtime = max(p.stat().st_mtime for p in backup_dir.iterdir() if p.is_dir())
+        except (OSError, ValueError):
+            dir_mtime = None
+        if dir_mtime != self._backups_cache[0]:
+            self._backups_cache = (
+                dir_mtime,
+                self.security_manager.backup_manager.list_backups(self.shell_config_path)
+            )
+        backups = self._backups_cache[1]
         backup_count = len(backups)
         latest_backup = backups[0]['timestamp'] if backups else "None"
         
+        table.add_row(self._sec_labels[0], self._sec_path_text)
+        table.add_row(self._sec_labels[1], Text(str(backup_count), style="green"))
+        table.add_row(self._sec_labels[2], Text(latest_backup, style="yellow"))
+
+        # Show file integrity status; rehash only when the file's mtime moves
+        try:
+            config_mtime = self.shell_config_path.stat().st_mtime
+        except OSError:
+            config_mtime = None
+        if config_mtime != self._integrity_cache[0]:
+            self._integrity_cache = (
+                config_mtime,
+                self.security_manager.verify_file_integrity(self.shell_config_path)
+            )
+        integrity_status = self._integrity_cache[1]
         table.add_row(
-            Text("Shell Config:", style="cyan"),
-            Text(str(self.shell_config_path), style="blue")
-        )
-        table.add_row(
-            Text("Backups:", style="cyan"),
-            Text(str(backup_count), style="green")
-        )
-        table.add_row(
-            Text("Latest Backup:", style="cyan"),
-            Text(latest_backup, style="yellow")
-        )
-        
-        # Show file integrity status
-        integrity_status = self.security_manager.verify_file_integrity(self.shell_config_path)
-        table.add_row(
-            Text("File Integrity:", style="cyan"),
+            self._sec_labels[3],
             Text("✓ Valid" if integrity_status else "✗ Modified", style="green" if integrity_status else "red")
         )
-        
-        return Panel(
-            table,
-            title="Security Status",
-            border_style="red"
-        )
+
+        # Swap the fresh table into the long-lived panel rather than
+        # rebuilding the panel itself every frame
+        self._sec_panel.renderable = table
+        return self._sec_panel
 
     async def handle_command(self, command: str) -> None:
         """Execute commands securely"""
@@ -174,15 +232,17 @@ class TerminalDecorator:
                 else:
                     self.console.print(f"Executing: {command}")
                 
-                # Execute command in sandbox
-                result = await self.security_manager.secure_command_execution(command)
-                
+                # Execute command in sandbox, streaming stdout as it
+                # arrives instead of buffering the whole run to EOF
+                result = await self.security_manager.secure_command_execution(
+                    command,
+                    on_output=lambda line: self.console.out(line.decode(errors='replace'), end='')
+                )
+
                 if result.returncode == 0:
                     if self.performance_manager.feature_manager.is_feature_loaded('animations'):
                         self.animation_manager.handle_event("command_success")
                     self.console.print("[green]Command completed successfully[/]")
-                    if result.stdout:
-                        print(result.stdout)
                 else:
                     if self.performance_manager.feature_manager.is_feature_loaded('animations'):
                         self.animation_manager.handle_event("command_error")
@@ -198,48 +258,60 @@ class TerminalDecorator:
         except Exception as e:
             self.console.print(f"[red]Error: {e}[/]")
 
-    def _update_loop(self) -> None:
+    def _refresh_layout(self) -> PerformanceMetrics:
+        """Blocking per-tick refresh; runs on the update executor"""
+        # Optimize performance before updating
+        self.performance_manager.optimize_performance()
+
+        # Update layout components based on loaded features
+        self.layout["header"].update(self.create_header())
+
+        # Main area with git info and system info
+        if self.performance_manager.feature_manager.is_feature_loaded('system_monitor'):
+            self._ensure_system_monitor()
+            self.layout["main"].split(
+                self.create_git_panel(),
+                self.create_system_info()
+            )
+
+        # Sidebar with security, tasks and tool status
+        self.layout["sidebar"].split(
+            self.create_security_panel(),
+            self.create_task_panel(),
+            self.create_tool_status_panel(),
+            self.create_performance_panel()
+        )
+
+        # Update footer if text effects are loaded
+        if self.performance_manager.feature_manager.is_feature_loaded('text_effects'):
+            self.layout["footer"].update(self.create_footer())
+
+        # Apply theme transitions if animations are enabled and system resources permit
+        metrics = self.performance_manager.get_average_metrics()
+        if (self.performance_manager.feature_manager.is_feature_loaded('animations') and
+            metrics.cpu_usage < 70):
+            self.theme_manager.update()
+        return metrics
+
+    async def _update_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        # The old max(0.25, 1/fps) clamp silently capped any fps above 4;
+        # the frame budget is fixed, so compute it once outside the loop
+        base_sleep = 1.0 / self.config['performance']['fps']
         with Live(self.layout, refresh_per_second=self.config['performance']['fps']) as live:
             while self.running:
                 try:
-                    # Optimize performance before updating
-                    self.performance_manager.optimize_performance()
-                    
-                    # Update layout components based on loaded features
-                    self.layout["header"].update(self.create_header())
-                    
-                    # Main area with git info and system info
-                    if self.performance_manager.feature_manager.is_feature_loaded('system_monitor'):
-                        self.layout["main"].split(
-                            self.create_git_panel(),
-                            self.create_system_info()
-                        )
-                    
-                    # Sidebar with security, tasks and tool status
-                    self.layout["sidebar"].split(
-                        self.create_security_panel(),
-                        self.create_task_panel(),
-                        self.create_tool_status_panel(),
-                        self.create_performance_panel()
-                    )
-                    
-                    # Update footer if text effects are loaded
-                    if self.performance_manager.feature_manager.is_feature_loaded('text_effects'):
-                        self.layout["footer"].update(self.create_footer())
-                    
-                    # Apply theme transitions if animations are enabled and system resources permit
-                    if (self.performance_manager.feature_manager.is_feature_loaded('animations') and 
-                        self.performance_manager.get_average_metrics().cpu_usage < 70):
-                        self.theme_manager.update()
-                    
-                    # Adaptive refresh rate based on system load
-                    metrics = self.performance_manager.get_average_metrics()
-                    sleep_time = max(0.25, 1 / self.config['performance']['fps'])
-                    if metrics.cpu_usage > 80:
-                        sleep_time *= 2  # Reduce refresh rate under high load
-                    
-                    time.sleep(sleep_time)
-                
+                    # Run the blocking psutil/render work off the event loop
+                    # so command handling stays responsive; the refresh
+                    # returns the metrics it already averaged
+                    metrics = await loop.run_in_executor(self._update_executor, self._refresh_layout)
+
+                    # Reduce refresh rate under high load
+                    sleep_time = base_sleep * 2 if metrics.cpu_usage > 80 else base_sleep
+                    await asyncio.sleep(sleep_time)
+
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
                     self.console.print(f"[red]Update error: {e}[/]", file=sys.stderr)
                     if self.ensure_accessibility():
@@ -251,8 +323,9 @@ class TerminalDecorator:
             self.running = False
             self.performance_manager.cleanup()
             self.tool_integration.cleanup()
-            if self.update_thread.is_alive():
-                self.update_thread.join()
+            if self.update_task is not None and not self.update_task.done():
+                self.update_task.cancel()
+            self._update_executor.shutdown(wait=False)
         except Exception as e:
             self.console.print(f"[red]Error during shutdown: {e}[/]")
         finally:
@@ -275,22 +348,32 @@ async def main():
     }
     
     decorator = TerminalDecorator(config)
-    
+
+    # Sleep on an event instead of polling; SIGINT sets it so shutdown is
+    # immediate and the loop never blocks in time.sleep
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop_event.set)
+    except NotImplementedError:
+        pass  # Platforms without signal handler support fall back to KeyboardInterrupt
+
     try:
         # Create initial backup
         decorator.backup_shell_config()
-        
+
         # Example usage with security features
         await decorator.handle_command("ls -la")
-        time.sleep(1)
-        
+        await asyncio.sleep(1)
+
         await decorator.handle_command("git status")
-        time.sleep(1)
-        
+        await asyncio.sleep(1)
+
         # Keep running until interrupted
-        while True:
-            time.sleep(1)
-    
+        await stop_event.wait()
+        decorator.stop()
+        print("\nTerminal decorator stopped.")
+
     except KeyboardInterrupt:
         decorator.stop()
         print("\nTerminal decorator stopped.")
@@ -4,9 +4,12 @@ import os
 import random
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from art import text2art, art_list
 import pyfiglet
 from rich.text import Text
+from rich.table import Table
 from rich.style import Style
 from rich.console import Console
 from rich.panel import Panel
@@ -14,9 +17,50 @@ from rich.align import Align
 from prompt_toolkit.styles import Style as PromptStyle
 import emoji
 
-@dataclass
+# One shared Console: instantiation probes terminal capabilities and
+# environment, which there's no reason to repeat per manager
+_CONSOLE = Console()
+
+# Parsed .flf font files, shared across renders; pyfiglet re-reads the
+# font from disk for every figlet_format call otherwise
+_FIGLET_CACHE: Dict[str, pyfiglet.Figlet] = {}
+
+@lru_cache(maxsize=256)
+def _render_art(text: str, font: str, use_figlet: bool) -> str:
+    """Render ASCII art once per (text, font); FIGlet layout is the
+    dominant cost in this module and the banner texts form a small set"""
+    if use_figlet:
+        fig = _FIGLET_CACHE.get(font)
+        if fig is None:
+            fig = _FIGLET_CACHE[font] = pyfiglet.Figlet(font=font)
+        return fig.renderText(text)
+    return text2art(text, font=font)
+
+@lru_cache(maxsize=256)
+def _emojize(alias: str) -> str:
+    """Resolve an emoji alias once; emojize walks the alias dict per call
+    and prompt icons are a small constant set"""
+    return emoji.emojize(alias, language='alias')
+
+# Every possible combination of the seven SGR attributes, indexed by a
+# 7-bit mask in the order bold/dim/italic/underline/blink/reverse/strike;
+# building all 128 escapes up front replaces the per-style branch-and-join
+_ANSI_TABLE = tuple(
+    "\033[%sm" % ";".join(
+        code for bit, code in enumerate(('1', '2', '3', '4', '5', '7', '9'))
+        if mask & (1 << bit)
+    ) if mask else ""
+    for mask in range(128)
+)
+
+@dataclass(frozen=True)
 class FontStyle:
-    """Professional font style configuration"""
+    """Professional font style configuration.
+
+    Instances are immutable, so the ANSI escape and the Rich style are
+    computed once at construction; prompt rendering then touches only
+    precomputed attributes.
+    """
     name: str
     bold: bool = False
     italic: bool = False
@@ -26,21 +70,11 @@ class FontStyle:
     blink: bool = False
     reverse: bool = False
 
-    def to_ansi(self) -> str:
-        """Convert to ANSI escape sequence"""
-        styles = []
-        if self.bold: styles.append('1')
-        if self.dim: styles.append('2')
-        if self.italic: styles.append('3')
-        if self.underline: styles.append('4')
-        if self.blink: styles.append('5')
-        if self.reverse: styles.append('7')
-        if self.strike: styles.append('9')
-        return f"\033[{';'.join(styles)}m" if styles else ""
-
-    def to_rich_style(self) -> Style:
-        """Convert to Rich style"""
-        return Style(
+    def __post_init__(self):
+        mask = (self.bold | self.dim << 1 | self.italic << 2 | self.underline << 3
+                | self.blink << 4 | self.reverse << 5 | self.strike << 6)
+        object.__setattr__(self, '_ansi', _ANSI_TABLE[mask])
+        object.__setattr__(self, '_rich_style', Style(
             bold=self.bold,
             italic=self.italic,
             underline=self.underline,
@@ -48,51 +82,76 @@ class FontStyle:
             dim=self.dim,
             blink=self.blink,
             reverse=self.reverse
-        )
+        ))
+
+    def to_ansi(self) -> str:
+        """Convert to ANSI escape sequence"""
+        return self._ansi
+
+    def to_rich_style(self) -> Style:
+        """Convert to Rich style"""
+        return self._rich_style
 
 class TextManager:
     """Professional text and banner management"""
     
     # Professional banner templates
     BANNER_TEMPLATES = {
-        'welcome': [
+        'welcome': (
             "Welcome to {name}'s Terminal",
             "Terminal Session - {name}",
             "{name}'s Development Environment",
             "Welcome Back, {name}!",
             "Terminal Pro - {name}'s Workspace"
-        ],
-        'motivational': [
+        ),
+        'motivational': (
             "Code with Purpose",
             "Build Something Amazing",
             "Create • Develop • Deploy",
             "Think • Code • Innovate",
             "Debug like a Detective",
             "Code with Excellence"
-        ],
-        'status': [
+        ),
+        'status': (
             "System Status: Optimal",
             "All Systems Operational",
             "Environment Ready",
             "Development Mode Active",
             "Terminal Pro Ready"
-        ]
+        )
     }
 
     # Professional font collections
     FONT_COLLECTIONS = {
-        'modern': ['slant', 'banner3-D', 'larry3d', 'colossal'],
-        'clean': ['standard', 'thin', 'small', 'mini'],
-        'decorative': ['block', 'cosmic', 'roman', 'broadway'],
-        'tech': ['cyberlarge', 'cybermedium', 'digital']
+        'modern': ('slant', 'banner3-D', 'larry3d', 'colossal'),
+        'clean': ('standard', 'thin', 'small', 'mini'),
+        'decorative': ('block', 'cosmic', 'roman', 'broadway'),
+        'tech': ('cyberlarge', 'cybermedium', 'digital')
     }
 
     def __init__(self):
-        self.console = Console()
-        self.available_fonts = pyfiglet.FigletFont.getFonts()
-        self.available_arts = art_list()
+        self.console = _CONSOLE
+        # Private RNG: skips the global random module's locking wrapper
+        # and makes banner selection seedable for reproducibility
+        self._rng = random.Random()
+        # Rendered welcome panels per name; the template set is fixed so
+        # each name's variants are built once
+        self._welcome_cache: Dict[str, tuple] = {}
+        # Fully assembled prompts keyed by their component tuples; REPL
+        # redraws rebuild the same prompt on every keystroke
+        self._prompt_cache: Dict[tuple, str] = {}
         self._load_custom_fonts()
 
+    @cached_property
+    def available_fonts(self) -> frozenset:
+        """Full FIGlet font index; scanning the font package directory is
+        slow, so it's deferred until a render actually needs it"""
+        return frozenset(pyfiglet.FigletFont.getFonts())
+
+    @cached_property
+    def available_arts(self) -> List[str]:
+        return art_list()
+
     def _load_custom_fonts(self):
         """Load custom font configurations"""
         self.font_styles = {
@@ -109,13 +168,10 @@ class TextManager:
                      color: Optional[str] = None, width: Optional[int] = None) -> Panel:
         """Create a professional banner with advanced styling"""
         if font is None:
-            font = random.choice(self.FONT_COLLECTIONS[style])
+            font = self._rng.choice(self.FONT_COLLECTIONS[style])
 
-        # Create ASCII art text
-        if font in self.available_fonts:
-            art_text = pyfiglet.figlet_format(text, font=font)
-        else:
-            art_text = text2art(text, font=font)
+        # Create ASCII art text (memoized per text/font pair)
+        art_text = _render_art(text, font, font in self.available_fonts)
 
         # Apply color and styling
         styled_text = Text(art_text)
@@ -130,33 +186,41 @@ class TextManager:
             width=width
         )
 
+    # The template/style/color combinations below are bounded, so the
+    # whole render pipeline collapses to picking from prebuilt panels;
+    # built on first use to keep construction lazy
+
+    @cached_property
+    def _motivational_banners(self) -> tuple:
+        return tuple(
+            self.create_banner(quote, style='decorative', color="bright_magenta")
+            for quote in self.BANNER_TEMPLATES['motivational']
+        )
+
+    @cached_property
+    def _status_banners(self) -> tuple:
+        return tuple(
+            self.create_banner(status, style='tech', color="bright_green")
+            for status in self.BANNER_TEMPLATES['status']
+        )
+
     def create_motivational_banner(self) -> Panel:
         """Create a random motivational banner"""
-        quote = random.choice(self.BANNER_TEMPLATES['motivational'])
-        return self.create_banner(
-            quote,
-            style='decorative',
-            color="bright_magenta"
-        )
+        return self._rng.choice(self._motivational_banners)
 
     def create_welcome_banner(self, name: str) -> Panel:
         """Create a personalized welcome banner"""
-        template = random.choice(self.BANNER_TEMPLATES['welcome'])
-        text = template.format(name=name)
-        return self.create_banner(
-            text,
-            style='modern',
-            color="bright_cyan"
-        )
+        banners = self._welcome_cache.get(name)
+        if banners is None:
+            banners = self._welcome_cache[name] = tuple(
+                self.create_banner(template.format(name=name), style='modern', color="bright_cyan")
+                for template in self.BANNER_TEMPLATES['welcome']
+            )
+        return self._rng.choice(banners)
 
     def create_status_banner(self) -> Panel:
         """Create a system status banner"""
-        status = random.choice(self.BANNER_TEMPLATES['status'])
-        return self.create_banner(
-            status,
-            style='tech',
-            color="bright_green"
-        )
+        return self._rng.choice(self._status_banners)
 
     def style_prompt_text(self, text: str, style: Union[str, FontStyle]) -> str:
         """Apply professional styling to prompt text"""
@@ -166,23 +230,23 @@ class TextManager:
 
     def create_dynamic_prompt(self, components: List[Dict[str, str]]) -> str:
         """Create a professional dynamic prompt"""
-        prompt_parts = []
-        
-        for comp in components:
-            text = comp.get('text', '')
-            style = comp.get('style', 'standard')
-            icon = comp.get('icon', '')
-            
-            if icon:
-                text = f"{emoji.emojize(icon, use_aliases=True)} {text}"
-            
-            prompt_parts.append(self.style_prompt_text(text, style))
-        
-        return " ".join(prompt_parts)
+        key = tuple(
+            (comp.get('text', ''), comp.get('style', 'standard'), comp.get('icon', ''))
+            for comp in components
+        )
+        cached = self._prompt_cache.get(key)
+        if cached is None:
+            prompt_parts = []
+            for text, style, icon in key:
+                if icon:
+                    text = f"{_emojize(icon)} {text}"
+                prompt_parts.append(self.style_prompt_text(text, style))
+            cached = self._prompt_cache[key] = " ".join(prompt_parts)
+        return cached
 
     def preview_fonts(self, text: str = "Sample Text"):
         """Preview available font styles"""
-        table = self.console.table(
+        table = Table(
             title="Available Font Styles",
             show_header=True,
             header_style="bold magenta"
@@ -190,17 +254,28 @@ class TextManager:
         table.add_column("Style Name")
         table.add_column("Preview")
 
-        for collection, fonts in self.FONT_COLLECTIONS.items():
-            for font in fonts:
-                if font in self.available_fonts:
-                    preview = pyfiglet.figlet_format(text, font=font, width=40)
-                    table.add_row(font, preview)
+        # Each render parses a .flf font file from disk; fan the
+        # independent renders out across a small pool instead of reading
+        # and laying out every font sequentially
+        fonts = [
+            font
+            for collection_fonts in self.FONT_COLLECTIONS.values()
+            for font in collection_fonts
+            if font in self.available_fonts
+        ]
+
+        def render(font: str) -> str:
+            return pyfiglet.Figlet(font=font, width=40).renderText(text)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for font, preview in zip(fonts, executor.map(render, fonts)):
+                table.add_row(font, preview)
 
         self.console.print(table)
 
     def preview_font_styles(self, text: str = "Sample Text"):
         """Preview font styling options"""
-        table = self.console.table(
+        table = Table(
             title="Font Style Previews",
             show_header=True,
             header_style="bold magenta"
@@ -220,15 +295,15 @@ if __name__ == "__main__":
     
     # Show welcome banner
     print("\nWelcome Banner:")
-    console.print(manager.create_welcome_banner("Developer"))
+    manager.console.print(manager.create_welcome_banner("Developer"))
     
     # Show motivational banner
     print("\nMotivational Banner:")
-    console.print(manager.create_motivational_banner())
+    manager.console.print(manager.create_motivational_banner())
     
     # Show status banner
     print("\nStatus Banner:")
-    console.print(manager.create_status_banner())
+    manager.console.print(manager.create_status_banner())
     
     # Show dynamic prompt example
     print("\nDynamic Prompt Example:")
@@ -1,54 +1,114 @@
 #!/usr/bin/env python3
 
+import os
+import sys
 import colorsys
 import json
 import time
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 from rich.color import Color
 from rich.style import Style
 from rich.theme import Theme
 import yaml
 from blessed import Terminal
 
-@dataclass
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _Loader
+
+@lru_cache(maxsize=16)
+def _parse_theme_file(filepath: str, mtime: float) -> dict:
+    """Parse a theme file once per (path, mtime); the mtime in the key
+    invalidates the cache when the file changes on disk"""
+    with open(filepath, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
+@lru_cache(maxsize=512)
+def _style_for(color: str) -> Style:
+    """Intern Style objects by color string; Style() re-parses its color
+    argument every time and palettes repeat colors across themes"""
+    return Style(color=color)
+
+@lru_cache(maxsize=512)
+def _style_for_rgb(r: int, g: int, b: int) -> Style:
+    """RGB variant: hands Rich the triplet directly instead of formatting
+    a hex string only for Style() to parse it straight back"""
+    return Style(color=Color.from_rgb(r, g, b))
+
+# Interned colors keyed by the raw hex string; palettes repeat entries
+# (e.g. the same accent in several roles), so equal colors share one
+# immutable instance
+_HEX_CACHE: Dict[str, 'ColorRGB'] = {}
+
+def _ansi_frame(arr) -> str:
+    """Format an (n, 3) uint8 array as one run of SGR sequences.
+
+    tolist() converts the whole array to Python ints in C, and the bound
+    %-format avoids constructing an f-string per numpy scalar, which
+    dominates the per-frame cost once the blend itself is vectorized.
+    """
+    return "".join(map("\033[38;2;%d;%d;%dm".__mod__, map(tuple, arr.tolist())))
+
+@dataclass(frozen=True)
 class ColorRGB:
     r: int
     g: int
     b: int
 
+    def __post_init__(self):
+        # Immutable, so both string forms are formatted exactly once
+        object.__setattr__(self, '_hex', f"#{self.r:02x}{self.g:02x}{self.b:02x}")
+        object.__setattr__(self, '_ansi', f"\033[38;2;{self.r};{self.g};{self.b}m")
+
     @classmethod
     def from_hex(cls, hex_color: str) -> 'ColorRGB':
         """Convert hex color to RGB"""
-        hex_color = hex_color.lstrip('#')
-        return cls(
-            r=int(hex_color[0:2], 16),
-            g=int(hex_color[2:4], 16),
-            b=int(hex_color[4:6], 16)
-        )
+        cached = _HEX_CACHE.get(hex_color)
+        if cached is None:
+            # One C-level parse instead of three int(..., 16) calls
+            r, g, b = bytes.fromhex(hex_color.lstrip('#'))
+            cached = _HEX_CACHE[hex_color] = cls(r, g, b)
+        return cached
 
     def to_hex(self) -> str:
         """Convert RGB to hex color"""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return self._hex
 
     def to_ansi(self) -> str:
         """Convert RGB to ANSI color code"""
-        return f"\033[38;2;{self.r};{self.g};{self.b}m"
+        return self._ansi
 
     def blend(self, other: 'ColorRGB', factor: float) -> 'ColorRGB':
         """Blend with another color using given factor (0-1)"""
-        return ColorRGB(
-            r=int(self.r + (other.r - self.r) * factor),
-            g=int(self.g + (other.g - self.g) * factor),
-            b=int(self.b + (other.b - self.b) * factor)
+        return _make_color(
+            int(self.r + (other.r - self.r) * factor),
+            int(self.g + (other.g - self.g) * factor),
+            int(self.b + (other.b - self.b) * factor)
         )
 
+@lru_cache(maxsize=4096)
+def _make_color(r: int, g: int, b: int) -> ColorRGB:
+    """Interned constructor: repeated triples (transition endpoints and
+    midpoints recur across frames) share one frozen instance"""
+    return ColorRGB(r, g, b)
+
 class ThemeDefinition:
     """Professional theme definition with color palette"""
     def __init__(self, name: str, colors: Dict[str, str]):
         self.name = name
-        self.colors = {k: ColorRGB.from_hex(v) if v.startswith('#') else v 
+        self.colors = {k: ColorRGB.from_hex(v) if v.startswith('#') else v
                       for k, v in colors.items()}
+        # Palette packed as an (n, 3) uint8 matrix so transitions can
+        # blend every color with one vectorized expression per frame
+        self._rgb_names = [n for n, c in self.colors.items() if isinstance(c, ColorRGB)]
+        self._rgb_array = np.array(
+            [(self.colors[n].r, self.colors[n].g, self.colors[n].b) for n in self._rgb_names],
+            dtype=np.uint8
+        ).reshape(-1, 3)
         self.styles = {}
         self._setup_styles()
 
@@ -56,9 +116,24 @@ class ThemeDefinition:
         """Setup Rich styles for the theme"""
         for name, color in self.colors.items():
             if isinstance(color, ColorRGB):
-                self.styles[name] = Style(color=color.to_hex())
+                self.styles[name] = _style_for_rgb(color.r, color.g, color.b)
             else:
-                self.styles[name] = Style(color=color)
+                self.styles[name] = _style_for(color)
+        # Derived views built once per theme: render loops read these as
+        # attributes instead of reassembling them per access
+        self.ansi_map = {n: c.to_ansi() if isinstance(c, ColorRGB) else ""
+                         for n, c in self.colors.items()}
+        self.rich_theme = Theme(self.styles)
+
+    def align_rgb(self, other: 'ThemeDefinition'):
+        """Rows of both palettes for names each theme defines as RGB, in
+        one shared order and widened to int16 for signed blend math"""
+        own_idx = {n: i for i, n in enumerate(self._rgb_names)}
+        names = [n for n in other._rgb_names if n in own_idx]
+        other_idx = {n: i for i, n in enumerate(other._rgb_names)}
+        own_rows = self._rgb_array[[own_idx[n] for n in names]].astype(np.int16)
+        other_rows = other._rgb_array[[other_idx[n] for n in names]].astype(np.int16)
+        return names, own_rows, other_rows
 
     def get_color(self, name: str) -> Optional[ColorRGB]:
         """Get color by name"""
@@ -157,10 +232,9 @@ class ThemeManager:
 
     def load_theme_file(self, filepath: str):
         """Load themes from YAML file"""
-        with open(filepath, 'r') as f:
-            theme_data = yaml.safe_load(f)
-            for name, colors in theme_data.items():
-                self.load_custom_theme(name, colors)
+        theme_data = _parse_theme_file(filepath, os.path.getmtime(filepath))
+        for name, colors in theme_data.items():
+            self.load_custom_theme(name, colors)
 
     def get_theme(self, name: str) -> Optional[ThemeDefinition]:
         """Get theme by name"""
@@ -180,66 +254,72 @@ class ThemeManager:
     def _transition_to_theme(self, new_theme: ThemeDefinition, duration: float):
         """Smooth transition between themes"""
         old_theme = self.current_theme
-        steps = int(duration * 60)  # 60 FPS
-        
-        for i in range(steps + 1):
-            factor = i / steps
-            transition_colors = {}
-            
-            for name, new_color in new_theme.colors.items():
-                if isinstance(new_color, ColorRGB):
-                    old_color = old_theme.colors.get(name)
-                    if isinstance(old_color, ColorRGB):
-                        transition_colors[name] = old_color.blend(new_color, factor)
-            
-            # Apply transition colors
-            self._apply_transition_colors(transition_colors)
-            time.sleep(duration / steps)
-        
-        self.current_theme = new_theme
 
-    def _apply_transition_colors(self, colors: Dict[str, ColorRGB]):
-        """Apply transition colors to terminal"""
-        for name, color in colors.items():
-            if hasattr(self.term, name):
-                setattr(self.term, name, color.to_ansi())
+        # Align the two palettes once; each frame is then one vectorized
+        # blend over the whole palette instead of a Python loop
+        # allocating a ColorRGB per color
+        names, old_arr, new_arr = old_theme.align_rgb(new_theme)
+        delta = new_arr - old_arr
+
+        # Deadline-based pacing: the blend factor comes from the clock,
+        # so sleep overshoot costs frames rather than stretching the
+        # transition, and each frame is one batched stdout write
+        frame_time = 1 / 60
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        start = time.perf_counter()
+        deadline = start + duration
+
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            factor = (now - start) / duration
+            blended = (old_arr + delta * factor).astype(np.uint8)
+            write(_ansi_frame(blended))
+            flush()
+            time.sleep(max(0.0, now + frame_time - time.perf_counter()))
+
+        # Land exactly on the target palette
+        write(_ansi_frame(new_arr.astype(np.uint8)))
+        flush()
+
+        self.current_theme = new_theme
 
     def get_rich_theme(self) -> Theme:
         """Get current theme as Rich Theme object"""
         if not self.current_theme:
             self.set_theme('default', transition=False)
-        
-        return Theme({
-            name: Style(color=color.to_hex() if isinstance(color, ColorRGB) else color)
-            for name, color in self.current_theme.colors.items()
-        })
+
+        return self.current_theme.rich_theme
 
     def list_themes(self) -> List[str]:
         """List available themes"""
         return list(self.themes.keys())
 
-    def preview_theme(self, name: str):
-        """Preview a theme"""
+    def preview_theme(self, name: str) -> str:
+        """Build a preview of a theme"""
         theme = self.get_theme(name)
         if not theme:
-            return
-        
-        print(f"\nTheme Preview: {name}")
-        print("=" * 40)
-        
+            return ""
+
+        lines = [f"\nTheme Preview: {name}", "=" * 40]
         for color_name, color in theme.colors.items():
             if isinstance(color, ColorRGB):
-                print(f"{color.to_ansi()}{color_name}: {color.to_hex()}\\033[0m")
+                lines.append(f"{color.to_ansi()}{color_name}: {color.to_hex()}\033[0m")
             else:
-                print(f"{color_name}: {color}")
-        
-        print("=" * 40)
+                lines.append(f"{color_name}: {color}")
+        lines.append("=" * 40)
+
+        return "\n".join(lines)
+
+    def preview_all(self):
+        """Print previews of every theme in a single write"""
+        sys.stdout.write("\n".join(self.preview_theme(name) for name in self.themes) + "\n")
 
 if __name__ == "__main__":
     # Example usage
     manager = ThemeManager()
     
     # Preview all built-in themes
-    for theme_name in manager.list_themes():
-        manager.preview_theme(theme_name)
-        print() 
\ No newline at end of file
+    manager.preview_all()
\ No newline at end of file
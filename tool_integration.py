@@ -2,19 +2,43 @@
 
 import os
 import sys
+import select
+import shutil
 import subprocess
 import threading
+import time
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import re
+from collections import ChainMap
 import json
-from pathlib import Path
 import asyncio
-from functools import lru_cache
 
-@dataclass
+try:
+    from croniter import croniter
+except ImportError:  # optional; next-run times degrade to now()
+    croniter = None
+
+# Parsed cron expressions keyed by schedule string; crontabs repeat
+# stock schedules like '0 * * * *' and parsing the expression is the
+# expensive half, so equal schedules share one parsed instance
+_cron_cache: Dict[str, Any] = {}
+
+def _fast_dt(s: str) -> datetime:
+    """Parse 'YYYY-MM-DD HH:MM:SS' by slicing.
+
+    strptime re-enters the locale-aware _strptime machinery on every
+    call; for the fixed-format timestamps systemctl emits, direct int
+    conversion of the known offsets is an order of magnitude cheaper.
+    """
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+# slots=True drops the per-instance __dict__; TaskStatus instances sit
+# in dicts by the hundred and the monitor thread iterates them forever
+
+@dataclass(slots=True)
 class GitStatus:
     branch: str
     is_clean: bool
@@ -24,10 +48,11 @@ class GitStatus:
     commits_ahead: int
     commits_behind: int
     conflicts: List[str]
-    last_commit: str
+    last_commit_hash: str
+    last_commit_message: str
     last_commit_time: datetime
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatus:
     name: str
     schedule: str
@@ -38,88 +63,164 @@ class TaskStatus:
 
 class GitIntegration:
     def __init__(self):
-        self.repo_path = None
+        self.repo_path: Optional[str] = None
         self._find_git_repo()
         self.status_cache_time = 2  # Cache git status for 2 seconds
         self._last_status: Optional[Tuple[float, GitStatus]] = None
+        self._git_state_key: Optional[Tuple[int, int]] = None
+        self._status_lock = threading.Lock()
 
     def _find_git_repo(self):
         """Find the git repository from current directory upwards"""
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / '.git').is_dir():
+        # Plain-string walk: os.path avoids allocating a Path object per
+        # ancestor just to issue one stat each
+        current = os.getcwd()
+        while True:
+            if os.path.isdir(os.path.join(current, '.git')):
                 self.repo_path = current
-                break
-            current = current.parent
-
-    def _run_git_command(self, *args) -> str:
-        """Run a git command and return its output"""
+                return
+            parent = os.path.dirname(current)
+            if parent == current:
+                return
+            current = parent
+
+    def _run_git_command(self, *args) -> bytes:
+        """Run a git command and return its raw output.
+
+        Output stays bytes: text=True would UTF-8-decode the whole
+        porcelain stream (O(repo status size)) when only the branch name
+        and commit subject actually need to be strings.
+        """
         if not self.repo_path:
-            return ""
+            return b""
         try:
             result = subprocess.run(
                 ['git'] + list(args),
                 cwd=self.repo_path,
                 capture_output=True,
-                text=True,
                 timeout=2
             )
             return result.stdout.strip()
         except (subprocess.TimeoutError, subprocess.SubprocessError):
-            return ""
+            return b""
+
+    def _run_git_porcelain_v2(self) -> Optional[Dict[str, Any]]:
+        """Collect branch, ahead/behind and file states in one git call.
+
+        `status --porcelain=v2 --branch` returns everything the old
+        symbolic-ref/status/rev-list trio produced, so one fork/exec
+        replaces three; -z keeps paths with whitespace intact.
+        """
+        out = self._run_git_command('status', '--porcelain=v2', '--branch', '-z')
+        if not out:
+            return None
+
+        branch = b''
+        oid = b''
+        ahead = behind = 0
+        staged = unstaged = untracked = 0
+        conflicts: List[str] = []
+
+        records = out.split(b'\0')
+        i = 0
+        while i < len(records):
+            line = records[i]
+            i += 1
+            if not line:
+                continue
+            tag = line[:1]
+            if tag == b'#':
+                if line.startswith(b'# branch.head '):
+                    branch = line[14:]
+                elif line.startswith(b'# branch.oid '):
+                    oid = line[13:]
+                elif line.startswith(b'# branch.ab '):
+                    a, b = line[12:].split()
+                    ahead, behind = abs(int(a)), abs(int(b))
+            elif tag == b'?':
+                untracked += 1
+            elif tag == b'u':
+                conflicts.append(line.split(b' ', 10)[10].decode('utf-8', 'replace'))
+            elif tag in (b'1', b'2'):
+                xy = line.split(b' ', 2)[1]
+                if xy[:1] != b'.':
+                    staged += 1
+                if xy[1:2] != b'.':
+                    unstaged += 1
+                if tag == b'2':
+                    i += 1  # rename entries carry the original path as an extra record
+
+        if branch == b'(detached)':
+            branch = oid[:7]
+
+        return {
+            'branch': branch.decode('utf-8', 'replace'),
+            'ahead': ahead,
+            'behind': behind,
+            'staged': staged,
+            'unstaged': unstaged,
+            'untracked': untracked,
+            'conflicts': conflicts
+        }
 
-    @lru_cache(maxsize=1)
     def get_status(self) -> Optional[GitStatus]:
         """Get current git repository status with caching"""
         if not self.repo_path:
             return None
 
-        current_time = time.time()
-        if (self._last_status and 
-            current_time - self._last_status[0] < self.status_cache_time):
-            return self._last_status[1]
+        # Invalidation gate: HEAD moves on commit/checkout and the index
+        # on staging (git status itself refreshes the index stat cache),
+        # so two stats decide whether anything could have changed before
+        # any subprocess is considered
+        try:
+            state_key = (
+                os.stat(os.path.join(self.repo_path, '.git', 'HEAD')).st_mtime_ns,
+                os.stat(os.path.join(self.repo_path, '.git', 'index')).st_mtime_ns
+            )
+        except OSError:
+            state_key = None
+
+        # TTL cache on the instance; lru_cache on a method would pin self
+        # and never expire, defeating the freshness window. monotonic is
+        # immune to wall-clock jumps. The lock keeps concurrent callers
+        # from racing the subprocess fan-out.
+        with self._status_lock:
+            now = time.monotonic()
+            if self._last_status:
+                if state_key is not None and state_key == self._git_state_key:
+                    return self._last_status[1]
+                if now - self._last_status[0] < self.status_cache_time:
+                    return self._last_status[1]
 
         try:
-            # Get branch info
-            branch = self._run_git_command('symbolic-ref', '--short', 'HEAD')
-            if not branch:
-                branch = self._run_git_command('rev-parse', '--short', 'HEAD')
-
-            # Get status counts
-            status = self._run_git_command('status', '--porcelain')
-            staged = len([line for line in status.split('\n') if line.startswith('A ')])
-            unstaged = len([line for line in status.split('\n') if line[1] == 'M'])
-            untracked = len([line for line in status.split('\n') if line.startswith('??')])
-
-            # Get ahead/behind counts
-            ahead_behind = self._run_git_command('rev-list', '--count', '--left-right', '@{upstream}...HEAD')
-            behind, ahead = map(int, ahead_behind.split()) if ahead_behind else (0, 0)
-
-            # Get conflicts
-            conflicts = [
-                line.split()[1] for line in status.split('\n')
-                if line.startswith('UU')
-            ]
+            info = self._run_git_porcelain_v2()
+            if info is None:
+                return None
 
-            # Get last commit info
-            last_commit = self._run_git_command('log', '-1', '--pretty=format:%h %s')
-            last_commit_time_str = self._run_git_command('log', '-1', '--pretty=format:%ci')
-            last_commit_time = datetime.strptime(last_commit_time_str, '%Y-%m-%d %H:%M:%S %z')
+            # One log call yields hash, timestamp and subject together;
+            # %cI is strict ISO 8601, which fromisoformat parses on a C
+            # fast path with no format-string interpretation
+            last_commit_raw = self._run_git_command('log', '-1', '--pretty=format:%h%x00%cI%x00%s')
+            commit_hash, commit_time_str, subject = last_commit_raw.decode('utf-8', 'replace').split('\0')
+            last_commit_time = datetime.fromisoformat(commit_time_str)
 
             status = GitStatus(
-                branch=branch,
-                is_clean=not (staged + unstaged + untracked),
-                staged=staged,
-                unstaged=unstaged,
-                untracked=untracked,
-                commits_ahead=ahead,
-                commits_behind=behind,
-                conflicts=conflicts,
-                last_commit=last_commit,
+                branch=info['branch'],
+                is_clean=not (info['staged'] + info['unstaged'] + info['untracked']),
+                staged=info['staged'],
+                unstaged=info['unstaged'],
+                untracked=info['untracked'],
+                commits_ahead=info['ahead'],
+                commits_behind=info['behind'],
+                conflicts=info['conflicts'],
+                last_commit_hash=commit_hash,
+                last_commit_message=subject,
                 last_commit_time=last_commit_time
             )
 
-            self._last_status = (current_time, status)
+            with self._status_lock:
+                self._last_status = (time.monotonic(), status)
+                self._git_state_key = state_key
             return status
 
         except Exception as e:
@@ -128,15 +229,35 @@ class GitIntegration:
 
 class TaskManager:
     def __init__(self):
-        self.tasks: Dict[str, TaskStatus] = {}
-        self._load_tasks()
-        self.monitor_thread = threading.Thread(target=self._monitor_tasks, daemon=True)
+        # Tasks partitioned by origin at load time, so consumers never
+        # re-classify by substring on every call; self.tasks stays a
+        # merged read view over both
+        self.cron_tasks: Dict[str, TaskStatus] = {}
+        self.systemd_tasks: Dict[str, TaskStatus] = {}
+        self.tasks = ChainMap(self.cron_tasks, self.systemd_tasks)
+        # Loading shells out to crontab/systemctl/journalctl, which can
+        # take seconds against a large journal; run it on the monitor
+        # thread so construction returns immediately, and only start
+        # watching pids once the task table actually exists
+        self._loaded = threading.Event()
+        self.monitor_thread = threading.Thread(target=self._load_then_monitor, daemon=True)
         self.monitor_thread.start()
 
+    @property
+    def loaded(self) -> bool:
+        """Whether the initial task load has completed"""
+        return self._loaded.is_set()
+
+    def _load_then_monitor(self):
+        self._load_tasks()
+        self._loaded.set()
+        self._monitor_tasks()
+
     def _load_tasks(self):
         """Load tasks from cron and systemd"""
         self._load_cron_tasks()
         self._load_systemd_tasks()
+        self._resolve_last_runs()
 
     def _load_cron_tasks(self):
         """Load user's crontab entries"""
@@ -145,12 +266,23 @@ class TaskManager:
             if crontab.returncode == 0:
                 for line in crontab.stdout.splitlines():
                     if line.strip() and not line.startswith('#'):
-                        schedule, *command = line.split(None, 5)
-                        name = ' '.join(command)
-                        self.tasks[name] = TaskStatus(
+                        parts = line.split(None, 5)
+                        # A schedule is five fields ('*/5 * * * *') or a
+                        # single '@daily'-style shorthand; keeping only
+                        # parts[0] fed croniter one field and always
+                        # failed to parse
+                        if parts[0].startswith('@') and len(parts) >= 2:
+                            schedule = parts[0]
+                            name = ' '.join(parts[1:])
+                        elif len(parts) == 6:
+                            schedule = ' '.join(parts[:5])
+                            name = parts[5]
+                        else:
+                            continue
+                        self.cron_tasks[name] = TaskStatus(
                             name=name,
                             schedule=schedule,
-                            last_run=self._get_last_run(name),
+                            last_run=datetime.min,
                             next_run=self._calculate_next_run(schedule),
                             status="scheduled",
                             pid=None
@@ -167,62 +299,168 @@ class TaskManager:
                 text=True
             )
             if timers.returncode == 0:
-                for line in timers.stdout.splitlines()[1:]:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            name = parts[4]
-                            self.tasks[name] = TaskStatus(
-                                name=name,
-                                schedule=parts[2],
-                                last_run=datetime.strptime(parts[1], '%Y-%m-%d %H:%M:%S'),
-                                next_run=datetime.strptime(parts[0], '%Y-%m-%d %H:%M:%S'),
-                                status="active" if "active" in parts else "inactive",
-                                pid=self._get_pid(name)
-                            )
+                entries = [
+                    line.split() for line in timers.stdout.splitlines()[1:]
+                    if line.strip()
+                ]
+                entries = [parts for parts in entries if len(parts) >= 5]
+                # One systemctl show for all units instead of a process
+                # per task
+                pids = self._get_pids([parts[4] for parts in entries])
+                for parts in entries:
+                    name = parts[4]
+                    self.systemd_tasks[name] = TaskStatus(
+                        name=name,
+                        schedule=parts[2],
+                        last_run=_fast_dt(parts[1]),
+                        next_run=_fast_dt(parts[0]),
+                        status="active" if "active" in parts else "inactive",
+                        pid=pids.get(name)
+                    )
         except Exception as e:
             logging.error(f"Error loading systemd timers: {e}")
 
-    def _get_last_run(self, task_name: str) -> datetime:
-        """Get last run time from system logs"""
+    def _resolve_last_runs(self):
+        """Fill in last_run for every task from one batched journal query.
+
+        The old per-task path spawned 'journalctl -n 1' for each entry,
+        opening the journal N times; one JSON query filtered to all units
+        at once costs a single process and a single journal scan, grouped
+        client-side by unit.
+        """
+        if not self.tasks:
+            return
+        cmd = ['journalctl', '--user', '-o', 'json',
+               '--output-fields=_SYSTEMD_USER_UNIT,__REALTIME_TIMESTAMP',
+               '--since', '-7d']
+        for name in self.tasks:
+            cmd += ['-u', name]
         try:
-            log = subprocess.run(
-                ['journalctl', '--user', '-u', task_name, '-n', '1'],
-                capture_output=True,
-                text=True
-            )
-            if log.returncode == 0 and log.stdout:
-                match = re.search(r'\w{3} \d{2} \d{2}:\d{2}:\d{2}', log.stdout)
-                if match:
-                    return datetime.strptime(match.group(), '%b %d %H:%M:%S')
-        except Exception:
-            pass
-        return datetime.min
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                return
+            latest: Dict[str, int] = {}
+            for line in result.stdout.splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                unit = entry.get('_SYSTEMD_USER_UNIT')
+                stamp = entry.get('__REALTIME_TIMESTAMP')
+                if unit and stamp and int(stamp) > latest.get(unit, 0):
+                    latest[unit] = int(stamp)
+            for unit, stamp in latest.items():
+                task = self.tasks.get(unit)
+                if task:
+                    task.last_run = datetime.fromtimestamp(stamp / 1_000_000)
+        except Exception as e:
+            logging.error(f"Error reading journal: {e}")
 
     def _calculate_next_run(self, schedule: str) -> datetime:
         """Calculate next run time from cron schedule"""
-        # Simplified calculation - in practice, use a cron parser library
-        return datetime.now()
-
-    def _get_pid(self, service_name: str) -> Optional[int]:
-        """Get PID of running systemd service"""
+        if croniter is None:
+            # Simplified fallback when no cron parser is installed
+            return datetime.now()
+        parsed = _cron_cache.get(schedule)
+        if parsed is None:
+            try:
+                parsed = _cron_cache[schedule] = croniter(schedule)
+            except ValueError:
+                return datetime.now()
+        parsed.set_current(datetime.now())
+        return parsed.get_next(datetime)
+
+    def _get_pids(self, names: List[str]) -> Dict[str, Optional[int]]:
+        """Get PIDs of running systemd services in one batched call.
+
+        systemctl show accepts many units at once and emits one
+        blank-line-separated property block per unit, so N per-service
+        fork/execs collapse into a single invocation.
+        """
+        if not names:
+            return {}
         try:
             result = subprocess.run(
-                ['systemctl', '--user', 'show', service_name, '--property=MainPID'],
+                ['systemctl', '--user', 'show', '-p', 'Id', '-p', 'MainPID'] + names,
                 capture_output=True,
                 text=True
             )
-            if result.returncode == 0:
-                pid = int(result.stdout.split('=')[1])
-                return pid if pid > 0 else None
+            if result.returncode != 0:
+                return {}
+            pids: Dict[str, Optional[int]] = {}
+            for block in result.stdout.split('\n\n'):
+                unit = None
+                pid = 0
+                for line in block.splitlines():
+                    key, _, value = line.partition('=')
+                    if key == 'Id':
+                        unit = value
+                    elif key == 'MainPID':
+                        try:
+                            pid = int(value)
+                        except ValueError:
+                            pid = 0
+                if unit:
+                    pids[unit] = pid if pid > 0 else None
+            return pids
         except Exception:
-            pass
-        return None
+            return {}
 
     def _monitor_tasks(self):
         """Monitor task status changes"""
+        if hasattr(os, 'pidfd_open') and hasattr(select, 'epoll'):
+            try:
+                self._monitor_tasks_pidfd()
+                return
+            except OSError:
+                pass  # e.g. pidfd_open blocked by seccomp; fall back to polling
+        self._monitor_tasks_poll()
+
+    def _monitor_tasks_pidfd(self):
+        """Event-driven monitor: sleep in epoll until a watched process exits.
+
+        A pidfd becomes readable exactly when its process terminates, so
+        instead of waking every 5 seconds to os.kill each task, the thread
+        blocks with zero wakeups while everything keeps running.
+        """
+        epoll = select.epoll()
+        fd_to_task: Dict[int, TaskStatus] = {}
+        watched: Dict[str, int] = {}
+        while True:
+            for name, task in list(self.tasks.items()):
+                if task.pid and watched.get(name) != task.pid:
+                    try:
+                        fd = os.pidfd_open(task.pid, 0)
+                    except OSError:
+                        # Already gone (or not ours to watch)
+                        task.status = "stopped"
+                        task.pid = None
+                        continue
+                    epoll.register(fd, select.EPOLLIN)
+                    fd_to_task[fd] = task
+                    watched[name] = task.pid
+                    task.status = "running"
+            # Long timeout only so newly discovered pids get registered;
+            # exits are reported the moment they happen
+            for fd, _ in epoll.poll(30):
+                epoll.unregister(fd)
+                os.close(fd)
+                task = fd_to_task.pop(fd, None)
+                if task:
+                    task.status = "stopped"
+                    task.pid = None
+
+    def _monitor_tasks_poll(self):
+        """Polling fallback for platforms without pidfd support"""
+        # Sweep a flat snapshot list: iterating the ChainMap re-walks two
+        # hash tables and their string keys every 5 seconds, while the
+        # task set only changes at (re)load. The list is rebuilt when the
+        # mapping's size moves.
+        watch: List[TaskStatus] = []
         while True:
-            for name, task in self.tasks.items():
+            if len(watch) != len(self.tasks):
+                watch = list(self.tasks.values())
+            for task in watch:
                 # Update task status
                 if task.pid:
                     try:
@@ -241,32 +479,28 @@ class ToolIntegration:
         self.fzf_support = self._check_fzf()
         self.htop_support = self._check_htop()
 
+    # Availability is a PATH lookup, not a process launch; shutil.which
+    # answers without the fork/exec the old --version probes paid
+
     def _check_tmux(self) -> bool:
-        """Check if tmux is available and get version"""
-        try:
-            result = subprocess.run(['tmux', '-V'], capture_output=True, text=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        """Check if tmux is available"""
+        return shutil.which('tmux') is not None
 
     def _check_fzf(self) -> bool:
         """Check if fzf is available"""
-        try:
-            result = subprocess.run(['fzf', '--version'], capture_output=True, text=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return shutil.which('fzf') is not None
 
     def _check_htop(self) -> bool:
         """Check if htop is available"""
-        try:
-            result = subprocess.run(['htop', '--version'], capture_output=True, text=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return shutil.which('htop') is not None
 
     def get_git_info(self) -> Dict[str, Any]:
         """Get formatted git repository information"""
+        # Outside a repo there is nothing to poll; answer without even
+        # entering get_status
+        if not self.git.repo_path:
+            return {'available': False}
+
         status = self.git.get_status()
         if not status:
             return {'available': False}
@@ -286,37 +520,43 @@ class ToolIntegration:
             },
             'conflicts': status.conflicts,
             'last_commit': {
-                'hash': status.last_commit.split()[0],
-                'message': ' '.join(status.last_commit.split()[1:]),
-                'time': status.last_commit_time.strftime('%Y-%m-%d %H:%M:%S')
+                'hash': status.last_commit_hash,
+                'message': status.last_commit_message,
+                # isoformat produces the same string on a C fast path,
+                # with no format-string interpretation; the tz is dropped
+                # so the output matches the old naive rendering
+                'time': status.last_commit_time.replace(tzinfo=None).isoformat(' ', 'seconds')
             }
         }
 
     def get_task_info(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get formatted task information"""
+        # First frames render empty rather than blocking on the
+        # background load
+        if not self.task_manager.loaded:
+            return {'cron_tasks': [], 'systemd_tasks': []}
+
         return {
             'cron_tasks': [
                 {
                     'name': name,
                     'schedule': task.schedule,
-                    'last_run': task.last_run.strftime('%Y-%m-%d %H:%M:%S'),
-                    'next_run': task.next_run.strftime('%Y-%m-%d %H:%M:%S'),
+                    'last_run': task.last_run.isoformat(' ', 'seconds'),
+                    'next_run': task.next_run.isoformat(' ', 'seconds'),
                     'status': task.status
                 }
-                for name, task in self.task_manager.tasks.items()
-                if 'cron' in task.schedule
+                for name, task in self.task_manager.cron_tasks.items()
             ],
             'systemd_tasks': [
                 {
                     'name': name,
                     'schedule': task.schedule,
-                    'last_run': task.last_run.strftime('%Y-%m-%d %H:%M:%S'),
-                    'next_run': task.next_run.strftime('%Y-%m-%d %H:%M:%S'),
+                    'last_run': task.last_run.isoformat(' ', 'seconds'),
+                    'next_run': task.next_run.isoformat(' ', 'seconds'),
                     'status': task.status,
                     'pid': task.pid
                 }
-                for name, task in self.task_manager.tasks.items()
-                if 'systemd' in task.schedule
+                for name, task in self.task_manager.systemd_tasks.items()
             ]
         }
 
@@ -334,37 +574,26 @@ class ToolIntegration:
             return False
 
         try:
-            # Create new session
-            result = await asyncio.create_subprocess_exec(
-                'tmux', 'new-session', '-d', '-s', name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await result.communicate()
-
-            # Create windows
+            # Chain session and window creation into one tmux invocation
+            # (';' separates tmux subcommands); one fork/exec and one
+            # server round-trip instead of 1 + 2 per window
+            tokens = ['new-session', '-d', '-s', name]
             for config in window_configs:
                 window_name = config.get('name', 'window')
                 command = config.get('command', '')
-                
-                # Create window
-                result = await asyncio.create_subprocess_exec(
-                    'tmux', 'new-window', '-t', f'{name}:', '-n', window_name,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                await result.communicate()
 
+                tokens += [';', 'new-window', '-t', f'{name}:', '-n', window_name]
                 if command:
-                    # Send command to window
-                    result = await asyncio.create_subprocess_exec(
-                        'tmux', 'send-keys', '-t', f'{name}:{window_name}', command, 'C-m',
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    await result.communicate()
+                    tokens += [';', 'send-keys', '-t', f'{name}:{window_name}', command, 'C-m']
 
-            return True
+            result = await asyncio.create_subprocess_exec(
+                'tmux', *tokens,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            await result.communicate()
+
+            return result.returncode == 0
 
         except Exception as e:
             logging.error(f"Error creating tmux session: {e}")